@@ -3,84 +3,100 @@
 Configuration constants for AWS DevOps agent.
 """
 
+import functools
 import os
 from dataclasses import dataclass
-from typing import ClassVar
 # Define a simple ConfigurationError here to avoid circular imports
 class ConfigurationError(Exception):
     """Configuration-related error."""
     pass
 
 
-@dataclass(frozen=True)
-class AWSConfig:
-    """AWS-related configuration."""
-    DEFAULT_REGION: ClassVar[str] = 'us-east-1'
-    
-    @classmethod
-    def setup_environment(cls) -> None:
-        """Set up AWS environment variables."""
-        os.environ['AWS_DEFAULT_REGION'] = cls.DEFAULT_REGION
-
-
-@dataclass(frozen=True)
-class ModelConfig:
-    """Model configuration with validation."""
-    MODEL_ID: ClassVar[str] = 'us.anthropic.claude-sonnet-4-20250514-v1:0'
-    MODEL_TEMPERATURE: ClassVar[float] = 0.3
-    
-    @classmethod
-    def validate(cls) -> None:
-        """Validate model configuration."""
-        if not (0.0 <= cls.MODEL_TEMPERATURE <= 1.0):
-            raise ConfigurationError(
-                f"MODEL_TEMPERATURE must be between 0.0 and 1.0, got {cls.MODEL_TEMPERATURE}"
-            )
-        
-        if not cls.MODEL_ID:
-            raise ConfigurationError("MODEL_ID cannot be empty")
-
-
-@dataclass(frozen=True)
-class TimeoutConfig:
-    """Timeout configuration with validation."""
-    SEARCH_TIMEOUT_SECONDS: ClassVar[int] = 10
-    AGENT_TIMEOUT_SECONDS: ClassVar[int] = 30
-    
-    @classmethod
-    def validate(cls) -> None:
-        """Validate timeout configuration."""
-        if cls.AGENT_TIMEOUT_SECONDS <= 0:
-            raise ConfigurationError(
-                f"AGENT_TIMEOUT_SECONDS must be positive, got {cls.AGENT_TIMEOUT_SECONDS}"
-            )
-        
-        if cls.SEARCH_TIMEOUT_SECONDS <= 0:
-            raise ConfigurationError(
-                f"SEARCH_TIMEOUT_SECONDS must be positive, got {cls.SEARCH_TIMEOUT_SECONDS}"
-            )
-
-
-def validate_configuration() -> None:
-    """Validate all configuration values."""
-    ModelConfig.validate()
-    TimeoutConfig.validate()
-
-
-# Initialize configuration
-AWSConfig.setup_environment()
-validate_configuration()
-
-# Backward compatibility - expose constants at module level
-AWS_DEFAULT_REGION = AWSConfig.DEFAULT_REGION
-MODEL_ID = ModelConfig.MODEL_ID
-MODEL_TEMPERATURE = ModelConfig.MODEL_TEMPERATURE
-SEARCH_TIMEOUT_SECONDS = TimeoutConfig.SEARCH_TIMEOUT_SECONDS
-AGENT_TIMEOUT_SECONDS = TimeoutConfig.AGENT_TIMEOUT_SECONDS
+# AWS Configuration
+AWS_DEFAULT_REGION = 'us-east-1'
+
+# Model Configuration
+MODEL_ID = 'us.anthropic.claude-sonnet-4-20250514-v1:0'
+MODEL_TEMPERATURE = 0.3
+# Model ID prefixes that support Bedrock latency-optimized inference
+LATENCY_OPTIMIZED_MODEL_PREFIXES = ('us.anthropic.claude-3-5-haiku-', 'us.meta.llama3-1-')
+
+# Bedrock Client Configuration
+BEDROCK_MAX_POOL_CONNECTIONS = 50
+BEDROCK_MAX_ATTEMPTS = 2
+BEDROCK_CONNECT_TIMEOUT_SECONDS = 3
+BEDROCK_READ_TIMEOUT_SECONDS = 30
+# Open the Bedrock connection in the background when the fast agent starts
+# (opt-in); the warmup request is rejected by validation, so it costs no tokens
+BEDROCK_WARMUP_ENABLED = os.environ.get('AWS_DEVOPS_BEDROCK_WARMUP') == '1'
+
+# Timeout Configuration
+SEARCH_TIMEOUT_SECONDS = 10
+AGENT_TIMEOUT_SECONDS = 30
+MCP_STARTUP_TIMEOUT_SECONDS = 30
+MCP_TOOLS_CACHE_TTL_SECONDS = 300
+
+# Response Cache Configuration: answer repeated prompts from earlier responses
+# (opt-in). Like the semantic cache it only answers the first turn of a
+# conversation, since later answers depend on the conversation history.
+RESPONSE_CACHE_ENABLED = os.environ.get('AWS_DEVOPS_RESPONSE_CACHE') == '1'
+RESPONSE_CACHE_MAX_ENTRIES = 512
+RESPONSE_CACHE_TTL_SECONDS = 3600
+RESPONSE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "aws-devops-agent")
+
+# Semantic Cache Configuration: answer paraphrased prompts from earlier
+# responses when their embeddings are similar enough (opt-in, first turn only)
+SEMANTIC_CACHE_ENABLED = os.environ.get('AWS_DEVOPS_SEMANTIC_CACHE') == '1'
+SEMANTIC_CACHE_THRESHOLD = 0.92
+SEMANTIC_CACHE_MAX_ENTRIES = 1000
+EMBEDDING_MODEL_ID = 'amazon.titan-embed-text-v2:0'
+EMBEDDING_DIMENSIONS = 256
 
 # Search Configuration
 DEFAULT_MAX_SEARCH_RESULTS = 3
 MAX_SEARCH_RESULTS_LIMIT = 5
+# Successful search results are reused for repeated queries for a random
+# time within this window, so entries cached together do not expire together
+SEARCH_CACHE_TTL_MIN_SECONDS = 240
+SEARCH_CACHE_TTL_MAX_SECONDS = 360
+SEARCH_CACHE_MAX_ENTRIES = 512
+# Empty results and search service errors are remembered briefly, so a query
+# repeated in a loop does not hit the search service every time
+SEARCH_NEGATIVE_CACHE_TTL_SECONDS = 30
+SEARCH_NEGATIVE_CACHE_MAX_ENTRIES = 256
+# Client-side search rate limit, kept below what DuckDuckGo tolerates so
+# searches are throttled locally instead of being rejected with a rate limit.
+# The rate starts at SEARCH_REQUESTS_PER_SECOND, grows slowly while searches
+# succeed and halves on every rate limit response, staying within the bounds.
+SEARCH_REQUESTS_PER_SECOND = 1.0
+SEARCH_MIN_REQUESTS_PER_SECOND = 0.1
+SEARCH_MAX_REQUESTS_PER_SECOND = 2.0
+SEARCH_BURST = 3
+# Maximum number of searches in flight at once
+SEARCH_CONCURRENCY = 4
+# Rate-limited and failed searches are retried with exponential backoff and
+# full jitter. Each retry waits for a rate limit token, and no retry starts
+# once the caller's SEARCH_TIMEOUT_SECONDS has run out.
+SEARCH_MAX_RETRIES = 2
+SEARCH_MAX_BACKOFF_SECONDS = 2.0
+# Queries searched in the background at startup so the first matching tool
+# call is answered from the cache, e.g. ("aws lambda pricing",)
+SEARCH_WARMUP_QUERIES: tuple[str, ...] = ()
+
+# MCP Configuration
+MCP_TOOL_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "aws-devops-agent")
+# Tool catalogs cached on disk for longer than this are still served at
+# startup, but re-verified against the server in the background
+MCP_TOOL_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+# Successful MCP server connectivity test results are reused for this long
+MCP_TEST_CACHE_TTL_SECONDS = 60 * 60
+# Optional exact versions for uvx-launched MCP server packages, e.g.
+# {"awslabs.eks-mcp-server": "0.1.0"}. Unpinned packages run from uv's cached
+# tool environment without re-resolving the latest release on every start.
+MCP_SERVER_VERSIONS: dict[str, str] = {}
+# Register one lightweight proxy tool per MCP server and only fetch a server's
+# tool schemas the first time the agent uses it
+MCP_LAZY_LOAD = os.environ.get('AWS_DEVOPS_MCP_LAZY_LOAD') == '1'
 
 # System Prompt
 SYSTEM_PROMPT = """You are AWS DevOps bot. Help with AWS infrastructure and operations.
@@ -105,21 +121,86 @@ EXIT_MESSAGE = "Happy DevOpsing!"
 EMPTY_INPUT_MESSAGE = "\nAWS-DevOps-bot > Please ask me something about DevOps on AWS!"
 PROCESSING_MESSAGE = "🤖 Processing your request..."
 
-# Tool Commands
-TOOL_COMMANDS = ["list tools", "show tools", "available tools", "what tools", "tools"]
-EXIT_COMMANDS = ["exit", "quit", "bye"]
+# Tool Commands (lowercase, matched against normalized user input)
+TOOL_COMMANDS = frozenset({"list tools", "show tools", "available tools", "what tools", "tools"})
+EXIT_COMMANDS = frozenset({"exit", "quit", "bye"})
 
 
-@dataclass(frozen=True)
-class FastAgentConfig:
-    """Fast agent specific configuration."""
-    EXIT_COMMANDS: ClassVar[list[str]] = ["exit", "quit", "bye"]
-    WELCOME_MESSAGE: ClassVar[str] = "⚡ Ultra-Fast AWS DevOps Bot (Knowledge Only)"
-    HELP_MESSAGE: ClassVar[str] = "💡 Instant responses - Type 'exit' to quit\n"
-    EXIT_MESSAGE: ClassVar[str] = "⚡ Fast DevOpsing!"
-    PROCESSING_MESSAGE: ClassVar[str] = "⚡ Instant response..."
-    EMPTY_INPUT_MESSAGE: ClassVar[str] = "AWS-DevOps-bot > Ask me about AWS DevOps!"
-    MAX_INPUT_LENGTH: ClassVar[int] = 1000
+def setup_aws_environment() -> None:
+    """Set up AWS environment variables, keeping a region the user already chose."""
+    os.environ.setdefault('AWS_DEFAULT_REGION', AWS_DEFAULT_REGION)
+
+
+def _validate_model() -> None:
+    """Validate model configuration."""
+    if not (0.0 <= MODEL_TEMPERATURE <= 1.0):
+        raise ConfigurationError(
+            f"MODEL_TEMPERATURE must be between 0.0 and 1.0, got {MODEL_TEMPERATURE}"
+        )
+    
+    if not MODEL_ID:
+        raise ConfigurationError("MODEL_ID cannot be empty")
+
+
+def _validate_timeouts() -> None:
+    """Validate timeout configuration."""
+    if AGENT_TIMEOUT_SECONDS <= 0:
+        raise ConfigurationError(
+            f"AGENT_TIMEOUT_SECONDS must be positive, got {AGENT_TIMEOUT_SECONDS}"
+        )
+    
+    if SEARCH_TIMEOUT_SECONDS <= 0:
+        raise ConfigurationError(
+            f"SEARCH_TIMEOUT_SECONDS must be positive, got {SEARCH_TIMEOUT_SECONDS}"
+        )
+    
+    if MCP_STARTUP_TIMEOUT_SECONDS <= 0:
+        raise ConfigurationError(
+            f"MCP_STARTUP_TIMEOUT_SECONDS must be positive, got {MCP_STARTUP_TIMEOUT_SECONDS}"
+        )
+    
+    if MCP_TOOLS_CACHE_TTL_SECONDS < 0:
+        raise ConfigurationError(
+            f"MCP_TOOLS_CACHE_TTL_SECONDS cannot be negative, got {MCP_TOOLS_CACHE_TTL_SECONDS}"
+        )
+
+
+def validate_configuration() -> None:
+    """Validate all configuration values."""
+    _validate_model()
+    _validate_timeouts()
+
+
+@functools.cache
+def initialize_configuration() -> None:
+    """
+    Set up the environment and validate configuration, once per process.
+    
+    Called by the entry points rather than at import time so that importing
+    constants stays cheap. Set AWS_DEVOPS_SKIP_VALIDATION=1 to skip validation.
+    """
+    setup_aws_environment()
+    if os.environ.get('AWS_DEVOPS_SKIP_VALIDATION') != '1':
+        validate_configuration()
+
+
+@functools.lru_cache(maxsize=1)
+def get_boto_session():
+    """Return a process-wide boto3 session, created on first use."""
+    import boto3
+    return boto3.Session()
+
+
+@functools.lru_cache(maxsize=1)
+def get_bedrock_client_config():
+    """Return the botocore client configuration shared by all Bedrock runtime clients."""
+    from botocore.config import Config
+    return Config(
+        max_pool_connections=BEDROCK_MAX_POOL_CONNECTIONS,
+        retries={'max_attempts': BEDROCK_MAX_ATTEMPTS, 'mode': 'adaptive'},
+        connect_timeout=BEDROCK_CONNECT_TIMEOUT_SECONDS,
+        read_timeout=BEDROCK_READ_TIMEOUT_SECONDS
+    )
 
 
 @dataclass(frozen=True)
@@ -130,9 +211,7 @@ class EnvironmentConfig:
     def validate_aws_credentials(cls) -> bool:
         """Check if AWS credentials are available."""
         try:
-            import boto3
-            session = boto3.Session()
-            credentials = session.get_credentials()
+            credentials = get_boto_session().get_credentials()
             return credentials is not None
         except Exception:
             return False
@@ -141,10 +220,9 @@ class EnvironmentConfig:
     def validate_bedrock_access(cls) -> bool:
         """Validate Bedrock model access."""
         try:
-            import boto3
-            client = boto3.client('bedrock', region_name=AWSConfig.DEFAULT_REGION)
-            # This is a lightweight check - just verify we can create the client
-            return True
+            # In-process check against botocore's bundled service models;
+            # creating a client here would load endpoint data for nothing
+            return 'bedrock' in get_boto_session().get_available_services()
         except Exception:
             return False
 
@@ -19,13 +19,14 @@ Features:
 
 import sys
 import os
-from pathlib import Path
+
+# Source directory, resolved once; sys.path tolerates it being missing
+_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
 
 def setup_path() -> None:
     """Add src directory to Python path for module imports."""
-    src_path = Path(__file__).parent / 'src'
-    if src_path.exists() and str(src_path) not in sys.path:
-        sys.path.insert(0, str(src_path))
+    if _SRC not in sys.path:
+        sys.path.insert(0, _SRC)
 
 def main() -> int:
     """Main entry point with proper error handling."""
@@ -9,17 +9,18 @@ Components:
     - Agent creation and management (agent.py)
     - Fast knowledge-only agent (fast_agent.py) 
     - MCP client lifecycle management (mcp_manager.py)
+    - Shared Bedrock model construction (models.py)
     - Custom exception hierarchy (exceptions.py)
     - Structured logging configuration (logger.py)
 
 Example:
     >>> from src.core import create_agent, FastAgent
-    >>> agent, tool_count, mcp_info, clients = create_agent()
+    >>> agent, tool_count, mcp_manager = create_agent()
     >>> fast_agent = FastAgent()
 """
 
-from .agent import create_agent, main as agent_main
-from .fast_agent import FastAgent, main as fast_main
+import importlib
+
 from .exceptions import (
     AgentError,
     AgentTimeoutError,
@@ -28,7 +29,27 @@ from .exceptions import (
     MCPToolLoadError,
 )
 from .logger import app_logger, cli_logger, mcp_logger
-from .mcp_manager import MCPManager
+
+# Agent components pull in strands, MCP and the Bedrock SDK, so they are
+# imported on first access rather than with the package
+_LAZY_EXPORTS = {
+    "create_agent": (".agent", "create_agent"),
+    "agent_main": (".agent", "main"),
+    "FastAgent": (".fast_agent", "FastAgent"),
+    "fast_main": (".fast_agent", "main"),
+    "MCPManager": (".mcp_manager", "MCPManager"),
+    "get_bedrock_model": (".models", "get_bedrock_model"),
+}
+
+
+def __getattr__(name: str):
+    """Import agent components lazily on first attribute access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_EXPORTS[name]
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
 
 __all__ = [
     # Agent components
@@ -37,6 +58,7 @@ __all__ = [
     "FastAgent",
     "fast_main",
     "MCPManager",
+    "get_bedrock_model",
     # Exception hierarchy (base first, then specific)
     "AgentError",
     "ConfigurationError",
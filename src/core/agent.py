@@ -1,48 +1,51 @@
 # Import Agent and tools
 import logging
-from contextlib import ExitStack
+import threading
 
 from strands.agent import Agent
-from strands.models.bedrock import BedrockModel
 
 # Import local modules
-from config.config import MODEL_ID, MODEL_TEMPERATURE, SYSTEM_PROMPT
-from tools.websearch_tool import websearch
+from config.config import (
+    MCP_LAZY_LOAD, MODEL_ID, MODEL_TEMPERATURE, SEARCH_WARMUP_QUERIES, SYSTEM_PROMPT
+)
+from tools.websearch_tool import warm_cache, websearch
 from core.mcp_manager import MCPManager
+from core.models import get_bedrock_model
 from interfaces.cli_interface import run_interactive_loop, run_fallback_loop
 
 # Configure logging
 logging.getLogger("strands").setLevel(logging.INFO)
 
 
-def create_agent() -> tuple[Agent, int, list, list]:
+def create_agent() -> tuple[Agent, int, MCPManager]:
     """
     Create and configure the agent with all available tools.
     
     Returns:
-        Tuple of (agent, tools_count, mcp_tool_info, mcp_clients)
+        Tuple of (agent, tools_count, mcp_manager); the manager owns the MCP
+        clients and tool information loaded for the agent
     """
-    # Create a Bedrock model instance with temperature control
-    model = BedrockModel(model_id=MODEL_ID, temperature=MODEL_TEMPERATURE)
-    
-    # Initialize tools list with websearch
-    tools = [websearch]
+    # Bedrock model with temperature control, shared across agents
+    model = get_bedrock_model(MODEL_ID, MODEL_TEMPERATURE)
     
     # Load MCP tools
-    mcp_manager = MCPManager()
-    mcp_tools, mcp_tool_info, mcp_clients = mcp_manager.load_mcp_tools()
-    tools.extend(mcp_tools)
+    mcp_manager = MCPManager(lazy_load=MCP_LAZY_LOAD)
+    mcp_tools, _, _ = mcp_manager.load_mcp_tools()
+    
+    # Build the tools list in one shot, websearch first
+    tools = [websearch, *mcp_tools]
     
     # Create the agent with available tools
     agent = Agent(model=model, system_prompt=SYSTEM_PROMPT, tools=tools)
     
-    return agent, len(tools), mcp_tool_info, mcp_clients
+    return agent, len(tools), mcp_manager
 
 
 def main():
     """Main application entry point with proper resource management."""
     import signal
     import sys
+    from config.config import initialize_configuration
     from core.logger import app_logger
     
     def signal_handler(signum, frame):
@@ -56,21 +59,31 @@ def main():
     signal.signal(signal.SIGTERM, signal_handler)
     
     try:
-        agent, tools_count, mcp_tool_info, mcp_clients = create_agent()
+        initialize_configuration()
+        agent, tools_count, mcp_manager = create_agent()
+        
+        if SEARCH_WARMUP_QUERIES:
+            # Daemon thread: warming must neither delay the prompt nor exit
+            threading.Thread(
+                target=warm_cache, args=(SEARCH_WARMUP_QUERIES,),
+                name="websearch-warmup", daemon=True
+            ).start()
         
         # Run the agent in a loop for interactive conversation
-        if mcp_clients:
-            # Use context managers for all MCP clients
-            with ExitStack() as stack:
-                mcp_manager = MCPManager()
-                mcp_manager.clients = mcp_clients
-                
-                if mcp_manager.enter_contexts(stack):
+        if mcp_manager.clients:
+            # Enter all MCP client contexts for the whole session
+            if mcp_manager.enter_contexts():
+                try:
                     print("🚀 Starting interactive loop with active MCP contexts...")
-                    run_interactive_loop(agent, tools_count, mcp_tool_info)
-                else:
-                    print("⚠️  Failed to enter MCP contexts, falling back to web search only")
-                    run_fallback_loop(agent, tools_count)
+                    # Keep tool catalogs fresh while the loop waits for input
+                    mcp_manager.start_background_refresh()
+                    run_interactive_loop(agent, tools_count, mcp_manager.tool_info)
+                finally:
+                    mcp_manager.stop_background_refresh()
+                    mcp_manager.exit_contexts()
+            else:
+                print("⚠️  Failed to enter MCP contexts, falling back to web search only")
+                run_fallback_loop(agent, tools_count)
         else:
             # Run without MCP clients (web search only)
             run_fallback_loop(agent, tools_count)
@@ -3,13 +3,32 @@
 Ultra-fast AWS DevOps agent - knowledge only, no external tools.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
+import operator
+import os
 import sys
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-from strands.agent import Agent
-from strands.models.bedrock import BedrockModel
-from config.config import MODEL_ID, MODEL_TEMPERATURE
+from config.config import (
+    BEDROCK_WARMUP_ENABLED, EMBEDDING_DIMENSIONS, EMBEDDING_MODEL_ID, MODEL_ID,
+    MODEL_TEMPERATURE, RESPONSE_CACHE_DIR, RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL_SECONDS, SEMANTIC_CACHE_ENABLED,
+    initialize_configuration
+)
+from core.models import get_bedrock_model
+from utils.async_utils import install_uvloop
+from utils.cache_utils import TTLCache
+from utils.input_utils import create_input_reader
+from utils.semantic_cache import SemanticCache
+from utils.timeout_utils import run_with_timeout_async
+
+if TYPE_CHECKING:
+    from strands.agent import Agent
 
 
 def setup_logging() -> None:
@@ -17,68 +36,134 @@ def setup_logging() -> None:
     # Suppress verbose strands logging
     logging.getLogger("strands").setLevel(logging.WARNING)
     
-    # Configure root logger
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[logging.StreamHandler(sys.stdout)]
-    )
+    # Skip per-record thread/process lookups and swallow handler errors
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.raiseExceptions = False
+    
+    # Configure root logger without timestamps, which would be formatted
+    # for every record
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    if not root_logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(levelname)s %(name)s: %(message)s'))
+        root_logger.addHandler(handler)
+
+
+_get_text = operator.itemgetter('text')
 
 
-def _get_text_from_item(item) -> str:
+def _get_text_from_item(item: object) -> str:
     """Extract text from various item types."""
-    if isinstance(item, dict):
-        return item.get('text', str(item))
-    if hasattr(item, 'text'):
-        return str(item.text)
-    return str(item)
+    try:
+        return _get_text(item)
+    except (KeyError, TypeError, IndexError):
+        pass
+    text = getattr(item, 'text', None)
+    return str(item if text is None else text)
+
+
+def _get_text_from_content(content: object) -> str:
+    """Extract text from a content block list or a single content item."""
+    if isinstance(content, list) and content:
+        return _get_text_from_item(content[0])
+    return _get_text_from_item(content)
+
 
+# Attribute holding the reply for each response type seen, probed once per
+# type. Types with a message attribute are not memoized: whether their reply
+# is in message depends on each instance's message being a dict.
+_RESPONSE_ATTRS: dict[type, Optional[str]] = {}
 
-def extract_response_content(response) -> str:
+
+def _response_attr(response: object) -> Optional[str]:
+    """Return the reply attribute of a response, memoized by response type."""
+    response_type = type(response)
+    try:
+        return _RESPONSE_ATTRS[response_type]
+    except KeyError:
+        pass
+    
+    if hasattr(response, 'message'):
+        if isinstance(response.message, dict):
+            return 'message'
+        return next(name for name in ('content', 'text', 'message') if hasattr(response, name))
+    
+    attr = next((name for name in ('content', 'text') if hasattr(response, name)), None)
+    _RESPONSE_ATTRS[response_type] = attr
+    return attr
+
+
+@functools.singledispatch
+def extract_response_content(response: object) -> str:
     """Extract content from agent response with simplified logic."""
-    # Handle AgentResult with message attribute
-    if hasattr(response, 'message') and isinstance(response.message, dict):
-        content = response.message.get('content', [])
-        if isinstance(content, list) and content:
-            return _get_text_from_item(content[0])
+    attr = _response_attr(response)
+    if attr is None:
+        return str(response)
     
+    value = getattr(response, attr, None)
+    # Handle message dicts like AgentResult.message
+    if attr == 'message' and isinstance(value, dict):
+        return _extract_from_message(value)
     # Handle direct content attribute
-    if hasattr(response, 'content'):
-        content = response.content
-        if isinstance(content, list) and content:
-            return _get_text_from_item(content[0])
-        return _get_text_from_item(content)
-    
+    if attr == 'content':
+        return _get_text_from_content(value)
     # Handle direct text attributes
-    for attr in ['text', 'message']:
-        if hasattr(response, attr):
-            return str(getattr(response, attr))
-    
-    # Handle dict response
-    if isinstance(response, dict):
-        if 'content' in response:
-            content = response['content']
-            if isinstance(content, list) and content:
-                return _get_text_from_item(content[0])
-            return _get_text_from_item(content)
-        if 'text' in response:
-            return str(response['text'])
-    
+    return str(value)
+
+
+@extract_response_content.register
+def _extract_from_dict(response: dict) -> str:
+    if 'content' in response:
+        return _get_text_from_content(response['content'])
+    if 'text' in response:
+        return str(response['text'])
     return str(response)
 
 
+@extract_response_content.register
+def _extract_from_str(response: str) -> str:
+    return response
+
+
+def _extract_from_message(message: dict[str, Any]) -> str:
+    """Extract the first content block's text from a message dict."""
+    content = message.get('content', [])
+    if isinstance(content, list) and content:
+        return _get_text_from_item(content[0])
+    return str(message)
+
+
+@functools.cache
+def _register_agent_result() -> None:
+    """Dispatch AgentResult directly; registered once strands has been imported."""
+    from strands.agent import AgentResult
+    
+    @extract_response_content.register
+    def _extract_from_agent_result(response: AgentResult) -> str:
+        if isinstance(response.message, dict):
+            return _extract_from_message(response.message)
+        return str(response.message)
+
+
+# Translation table deleting ASCII control characters other than tab,
+# newline and carriage return
+_CONTROL_CHARS_TABLE = dict.fromkeys(code for code in range(32) if chr(code) not in '\t\n\r')
+
+
 def validate_user_input(user_input: str, max_length: int = 1000) -> tuple[bool, Optional[str]]:
     """Validate user input with comprehensive checks."""
-    if not user_input or not user_input.strip():
-        return False, "Empty input"
-    
     cleaned_input = user_input.strip()
+    if not cleaned_input:
+        return False, "Empty input"
     
     if len(cleaned_input) > max_length:
         return False, f"Input too long (max {max_length} characters)"
     
     # Check for control characters (more comprehensive)
-    if any(ord(char) < 32 and char not in '\t\n\r' for char in cleaned_input):
+    if len(cleaned_input.translate(_CONTROL_CHARS_TABLE)) != len(cleaned_input):
         return False, "Invalid control characters in input"
     
     return True, None
@@ -92,7 +177,9 @@ class FastAgent:
     MAX_INPUT_LENGTH = 1000
     MAX_ERROR_MESSAGE_LENGTH = 100
     QUERY_TIMEOUT_SECONDS = 30
-    EXIT_COMMANDS = ["exit", "quit", "bye"]
+    WARMUP_ON_START = BEDROCK_WARMUP_ENABLED
+    EXIT_COMMANDS = frozenset({"exit", "quit", "bye"})
+    MAX_EXIT_COMMAND_LENGTH = max(map(len, EXIT_COMMANDS))
     
     # UI Messages
     WELCOME_MESSAGE = "⚡ Ultra-Fast AWS DevOps Bot (Knowledge Only)"
@@ -117,69 +204,301 @@ NON-FUNCTIONAL RULES:
     def __init__(self):
         """Initialize the fast agent."""
         self.logger = logging.getLogger(__name__)
+        
         try:
-            self.model = BedrockModel(model_id=MODEL_ID, temperature=MODEL_TEMPERATURE)
-            self.agent = Agent(model=self.model, system_prompt=self.SYSTEM_PROMPT, tools=[])
+            # Latency-optimized inference is requested only for supported models
+            self.model = get_bedrock_model(MODEL_ID, MODEL_TEMPERATURE, latency_optimized=True)
+            self.agent = self._create_agent()
+            self._response_cache: Optional[TTLCache[str]] = (
+                TTLCache(RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL_SECONDS)
+                if RESPONSE_CACHE_ENABLED else None
+            )
+            self._semantic_cache: Optional[SemanticCache] = (
+                SemanticCache(self._semantic_cache_path()) if SEMANTIC_CACHE_ENABLED else None
+            )
+            self._caching_enabled = any(
+                cache is not None
+                for cache in (self._response_cache, self._semantic_cache)
+            )
+            self._cache_counts = {"exact_hits": 0, "semantic_hits": 0, "misses": 0}
+            if self.WARMUP_ON_START:
+                threading.Thread(target=self._warm_up, name="bedrock-warmup", daemon=True).start()
             self.logger.info("Fast agent initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize fast agent: {e}")
             raise
     
-    def process_query(self, user_input: str) -> str:
+    def _warm_up(self) -> None:
+        """
+        Resolve credentials and open the Bedrock connection before the first query.
+        
+        Sends a Converse request without messages, which Bedrock rejects during
+        validation, so no tokens are spent; the pooled TLS connection and the
+        resolved credentials are then reused by the first real query.
+        """
+        from botocore.exceptions import ClientError
+        
+        try:
+            self.model.client.converse(modelId=MODEL_ID, messages=[])
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code")
+            if error_code != "ValidationException":
+                self.logger.warning(f"Bedrock warmup failed: {e}")
+                return
+        except Exception as e:
+            self.logger.warning(f"Bedrock warmup failed: {e}")
+            return
+        self.logger.debug("Bedrock warmup complete")
+    
+    def _create_agent(self) -> 'Agent':
+        """Create a knowledge-only agent on the shared model."""
+        # Deferred so the Bedrock SDK is only loaded when an agent is created
+        from strands.agent import Agent
+        
+        _register_agent_result()
+        # Output is written by the CLI loop, not by strands' printing handler
+        return Agent(
+            model=self.model, system_prompt=self.SYSTEM_PROMPT, tools=[], callback_handler=None
+        )
+    
+    def process_query(self, user_input: str, on_text: Optional[Callable[[str], None]] = None) -> str:
         """Process user query and return response."""
+        return asyncio.run(self.aprocess_query(user_input, on_text=on_text))
+    
+    async def aprocess_query(
+        self,
+        user_input: str,
+        agent: Optional['Agent'] = None,
+        on_text: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """
+        Process user query without blocking the event loop.
+        
+        Args:
+            user_input: Query to answer
+            agent: Agent to answer with; defaults to the conversational agent
+            on_text: Called with each chunk of the model's reply as it streams
+                in; not called for cached responses or errors
+        """
+        response, _ = await self._answer_query(user_input, agent, on_text)
+        return response
+    
+    async def _answer_query(
+        self,
+        user_input: str,
+        agent: Optional['Agent'] = None,
+        on_text: Optional[Callable[[str], None]] = None
+    ) -> tuple[str, bool]:
+        """
+        Answer a query as aprocess_query() does, reporting whether the model answered.
+        
+        Returns:
+            Tuple of (response, answered), where answered is False for timeout
+            and error messages, which may follow text already streamed to on_text
+        """
+        agent = agent or self.agent
+        # Cache keys only cover the prompt, so cached answers are only used
+        # and stored for the first turn of a conversation; later turns may
+        # depend on what was said before
+        use_cache = self._caching_enabled and not agent.messages
+        
+        cache_key = None
+        if use_cache and self._response_cache is not None:
+            cache_key = self._cache_key(user_input)
+            cached_response = self._response_cache.get(cache_key)
+            if cached_response is not None:
+                self._cache_counts["exact_hits"] += 1
+                return self._record_cached_turn(agent, user_input, cached_response), True
+        
+        embedding = None
+        if use_cache and self._semantic_cache is not None:
+            try:
+                embedding = await asyncio.to_thread(self._semantic_cache.embed, user_input)
+            except Exception as e:
+                self.logger.warning(f"Semantic cache lookup failed: {e}")
+            else:
+                cached_response = self._semantic_cache.lookup(embedding)
+                if cached_response is not None:
+                    self._cache_counts["semantic_hits"] += 1
+                    return self._record_cached_turn(agent, user_input, cached_response), True
+        
+        if use_cache:
+            self._cache_counts["misses"] += 1
+        
         try:
-            response = self.agent(user_input)
-            return extract_response_content(response)
+            response = await run_with_timeout_async(
+                self._invoke(agent, user_input, on_text),
+                self.QUERY_TIMEOUT_SECONDS,
+                message=f"Query timed out after {self.QUERY_TIMEOUT_SECONDS} seconds"
+            )
+            content = extract_response_content(response)
+            if cache_key is not None:
+                self._response_cache.set(cache_key, content)
+            if embedding is not None:
+                self._semantic_cache.add(embedding, content)
+            return content, True
         except TimeoutError as e:
             self.logger.error(f"Query timeout: {e}")
-            return "⚡ Response timeout - please try a simpler query"
+            return "⚡ Response timeout - please try a simpler query", False
         except Exception as e:
             self.logger.error(f"Error processing query: {e}")
             error_msg = str(e)
             if len(error_msg) > self.MAX_ERROR_MESSAGE_LENGTH:
                 error_msg = error_msg[:self.MAX_ERROR_MESSAGE_LENGTH] + "..."
-            return f"⚡ Sorry, I encountered an error: {error_msg}"
+            return f"⚡ Sorry, I encountered an error: {error_msg}", False
+    
+    @staticmethod
+    def _record_cached_turn(agent: 'Agent', user_input: str, response: str) -> str:
+        """Add a turn answered from the cache to the agent's history, returning the response."""
+        # Keeps the conversation in sync with what the user saw, so follow-up
+        # questions have the cached answer as context
+        agent.messages.append({"role": "user", "content": [{"text": user_input}]})
+        agent.messages.append({"role": "assistant", "content": [{"text": response}]})
+        return response
+    
+    async def _invoke(self, agent: 'Agent', user_input: str, on_text: Optional[Callable[[str], None]]):
+        """Run the agent, streaming reply text to on_text when given."""
+        if on_text is None:
+            return await agent.invoke_async(user_input)
+        
+        result = None
+        async for event in agent.stream_async(user_input):
+            if "data" in event:
+                on_text(event["data"])
+            elif "result" in event:
+                result = event["result"]
+        return result
+    
+    def _cache_key(self, user_input: str) -> str:
+        """Hash everything that determines the response to a prompt."""
+        payload = json.dumps(
+            {
+                "model": MODEL_ID,
+                "prompt": user_input,
+                "system": self.SYSTEM_PROMPT,
+                "temperature": MODEL_TEMPERATURE,
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _semantic_cache_path(self) -> str:
+        """Semantic cache file, scoped to everything that shapes the cached answers."""
+        scope = json.dumps([MODEL_ID, self.SYSTEM_PROMPT, EMBEDDING_MODEL_ID, EMBEDDING_DIMENSIONS])
+        digest = hashlib.sha256(scope.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(RESPONSE_CACHE_DIR, f"semantic-cache-{digest}.json")
+    
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Response cache hits by cache and misses; empty when caching is disabled."""
+        if not self._caching_enabled:
+            return {}
+        return dict(self._cache_counts)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        if self._response_cache is not None:
+            self._response_cache.clear()
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
+        self._cache_counts = dict.fromkeys(self._cache_counts, 0)
     
-    def run_interactive_loop(self) -> None:
+    async def process_queries_batch(self, prompts: list[str]) -> list[str]:
+        """
+        Answer independent prompts concurrently.
+        
+        Each prompt gets its own agent on the shared model, so the requests
+        overlap on the network without mixing conversation histories.
+        
+        Args:
+            prompts: Queries to answer
+            
+        Returns:
+            Responses in the order of the prompts
+        """
+        return await asyncio.gather(
+            *(self.aprocess_query(prompt, self._create_agent()) for prompt in prompts)
+        )
+    
+    @classmethod
+    def display_banner(cls) -> None:
+        """Print the welcome banner; needs no agent, so it can show before one exists."""
+        sys.stdout.write(f"{cls.WELCOME_MESSAGE}\n{cls.HELP_MESSAGE}\n")
+    
+    def run_interactive_loop(self, show_banner: bool = True) -> None:
         """Run the interactive command loop."""
-        print(self.WELCOME_MESSAGE)
-        print(self.HELP_MESSAGE)
+        if show_banner:
+            self.display_banner()
+        
+        # Bind per-turn lookups once, outside the loop
+        log_error = self.logger.error
+        answer_query = self._answer_query
+        exit_commands = self.EXIT_COMMANDS
+        max_exit_command_length = self.MAX_EXIT_COMMAND_LENGTH
+        max_input_length = self.MAX_INPUT_LENGTH
+        processing_message = self.PROCESSING_MESSAGE
+        exit_message = self.EXIT_MESSAGE
+        read_input = create_input_reader(exit_commands)
+        bot_prefix = "AWS-DevOps-bot > "
+        write = sys.stdout.write
+        flush = sys.stdout.flush
         
         while True:
             try:
-                user_input = input("You > ").strip()
+                user_input = read_input("You > ").strip()
                 
-                if user_input.lower() in self.EXIT_COMMANDS:
-                    print(self.EXIT_MESSAGE)
+                # Only inputs short enough to be a command need lowercasing
+                if (len(user_input) <= max_exit_command_length
+                        and user_input.lower() in exit_commands):
+                    print(exit_message)
                     break
                 
-                is_valid, error_msg = validate_user_input(user_input, self.MAX_INPUT_LENGTH)
+                is_valid, error_msg = validate_user_input(user_input, max_input_length)
                 if not is_valid:
                     print(f"AWS-DevOps-bot > {error_msg}")
                     continue
                 
-                print(self.PROCESSING_MESSAGE)
-                response = self.process_query(user_input)
-                print(f"AWS-DevOps-bot > {response}")
+                print(processing_message)
+                streamed = False
+                
+                def write_chunk(text: str) -> None:
+                    nonlocal streamed
+                    if not streamed:
+                        write(f"{bot_prefix}{text}")
+                        streamed = True
+                    else:
+                        write(text)
+                    flush()
+                
+                response, answered = asyncio.run(answer_query(user_input, on_text=write_chunk))
+                if streamed:
+                    write("\n")
+                # A timeout or error after streaming began still has to be shown
+                if not (streamed and answered):
+                    print(f"{bot_prefix}{response}")
                 
             except KeyboardInterrupt:
-                print(f"\n{self.EXIT_MESSAGE}")
+                print(f"\n{exit_message}")
                 break
             except EOFError:
-                print(f"\n{self.EXIT_MESSAGE}")
+                print(f"\n{exit_message}")
                 break
             except Exception as e:
-                self.logger.error(f"Unexpected error in main loop: {e}")
+                log_error(f"Unexpected error in main loop: {e}")
                 print(f"AWS-DevOps-bot > Unexpected error: {e}")
 
 
 def main() -> int:
     """Main entry point for the fast agent."""
     setup_logging()
+    install_uvloop()
     
     try:
+        initialize_configuration()
+        # Show the banner before the Bedrock SDK is imported by FastAgent()
+        FastAgent.display_banner()
         agent = FastAgent()
-        agent.run_interactive_loop()
+        agent.run_interactive_loop(show_banner=False)
         return 0
     except Exception as e:
         print(f"❌ Failed to start fast agent: {e}")
@@ -3,9 +3,21 @@
 MCP Manager for handling MCP client lifecycle and tool loading.
 """
 
-from contextlib import ExitStack
-from typing import List, Dict, Any, Tuple
-from utils.mcp_utils import MCP_SERVERS, create_mcp_client, get_tool_info
+import io
+import json
+import re
+import sys
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
+from typing import List, Dict, Any, Optional, TextIO, Tuple
+from config.config import MCP_TOOL_CACHE_MAX_AGE_SECONDS, MCP_TOOLS_CACHE_TTL_SECONDS
+from core.logger import mcp_logger
+from utils.mcp_utils import (
+    MCP_SERVERS, ToolInfoEntry, create_mcp_client, get_tool_info,
+    load_cached_tools, tool_cache_key
+)
 
 
 class MCPManager:
@@ -17,8 +29,12 @@ class MCPManager:
         self.tools = []
         self.lazy_load = lazy_load
         self._loaded_servers = set()
+        # Proxy tools can run concurrently, so first-use tracking is locked
+        self._loaded_servers_lock = threading.Lock()
+        self._entered_clients = []
+        self._refresh_stop: Optional[threading.Event] = None
     
-    def load_mcp_tools(self) -> Tuple[List, List[Dict[str, Any]], List]:
+    def load_mcp_tools(self) -> Tuple[List, List[ToolInfoEntry], List]:
         """
         Load tools from all configured MCP servers.
         
@@ -29,68 +45,202 @@ class MCPManager:
             return self._load_tools_lazy()
         return self._load_tools_eager()
     
-    def _load_tools_eager(self) -> Tuple[List, List[Dict[str, Any]], List]:
+    def _load_tools_eager(self) -> Tuple[List, List[ToolInfoEntry], List]:
         """Load all tools immediately."""
         return self._load_servers(MCP_SERVERS)
     
-    def _load_tools_lazy(self) -> Tuple[List, List[Dict[str, Any]], List]:
-        """Load tools on-demand (placeholder for future enhancement)."""
-        # For now, just load eagerly - can be enhanced later
-        return self._load_tools_eager()
-    
-    def _load_servers(self, server_configs: List[Dict]) -> Tuple[List, List[Dict[str, Any]], List]:
-        """Load tools from specified server configurations."""
-        for server_config in server_configs:
+    def _load_tools_lazy(self) -> Tuple[List, List[ToolInfoEntry], List]:
+        """
+        Register one proxy tool per server without starting any of them.
+        
+        Only each server's name and one-line description reach the model at
+        startup; a server's real tool schemas are fetched the first time its
+        proxy is invoked.
+        """
+        for server_config in MCP_SERVERS:
             try:
                 client = create_mcp_client(
-                    server_config["command"], 
+                    server_config["command"],
                     server_config["args"],
-                    server_config.get("env")
+                    server_config.get("env"),
+                    lazy=not server_config.get("warm", False),
+                    disk_cache_key=tool_cache_key(server_config)
                 )
-                
-                # Get tools from the MCP server within context manager
-                with client:
-                    mcp_tools = client.list_tools_sync()
-                    print(f"📋 {server_config['name']} loaded {len(mcp_tools)} tools")
-                    
-                    # Store tool information for display
-                    for tool in mcp_tools:
-                        tool_info = get_tool_info(tool)
-                        self.tool_info.append({
-                            'server': server_config['name'],
-                            'name': tool_info['name'],
-                            'description': tool_info['description']
-                        })
-                    
-                    self.tools.extend(mcp_tools)
-                    print(f"✅ {server_config['name']} MCP server tools loaded successfully")
-                
-                # Keep client for runtime usage
-                self.clients.append(client)
-                
-            except ConnectionError as e:
-                print(f"⚠️  Connection Error: Could not connect to {server_config['name']}: {e}")
-            except ImportError as e:
-                print(f"⚠️  Import Error: Missing dependency for {server_config['name']}: {e}")
-                self._print_installation_help()
             except Exception as e:
-                print(f"⚠️  Warning: Could not load {server_config['name']} tools: {e}")
+                print(f"⚠️  Warning: Could not configure {server_config['name']}: {e}")
+                continue
+            
+            proxy = self._create_proxy_tool(server_config, client)
+            self.clients.append(client)
+            self.tools.append(proxy)
+            self.tool_info.append(ToolInfoEntry.create(
+                server_config['name'], proxy.tool_name, server_config.get('description', '')
+            ))
+            print(f"⏳ {server_config['name']} registered for on-demand loading")
         
         return self.tools, self.tool_info, self.clients
     
-    def _print_installation_help(self):
-        """Print installation help for MCP dependencies."""
-        print("📝 To enable MCP servers:")
-        print("   1. Install uv: curl -LsSf https://astral.sh/uv/install.sh | sh")
-        print("   2. Ensure uvx is in your PATH")
+    def _create_proxy_tool(self, server_config: Dict, client: Any) -> Any:
+        """
+        Build the proxy tool standing in for one MCP server.
+        
+        Called without ``tool_name`` the proxy returns the server's tool
+        catalog with input schemas; called with it, the named tool is run with
+        ``arguments``. Discovery is memoized by the client's tool cache.
+        """
+        from strands import tool
+        
+        server_name = server_config['name']
+        proxy_name = "mcp_" + re.sub(r'\W+', '_', server_name.lower()).strip('_')
+        description = (
+            f"{server_config.get('description', f'Tools from the {server_name} MCP server.')} "
+            "Call without tool_name to list the available tools and their input "
+            "schemas, then call again with tool_name and arguments to run one."
+        )
+        
+        @tool(name=proxy_name, description=description)
+        def server_proxy(tool_name: str = "", arguments: Optional[Dict[str, Any]] = None) -> str:
+            """
+            Args:
+                tool_name: Name of the server tool to run; empty to list tools
+                arguments: Input for the server tool, matching its input schema
+            """
+            mcp_tools = {mcp_tool.tool_name: mcp_tool for mcp_tool in client.list_tools_sync()}
+            with self._loaded_servers_lock:
+                first_use = server_name not in self._loaded_servers
+                self._loaded_servers.add(server_name)
+            if first_use:
+                mcp_logger.info(f"{server_name} loaded {len(mcp_tools)} tools on first use")
+            
+            if not tool_name:
+                return "\n".join(
+                    f"{name}: {get_tool_info(mcp_tool)['description']}\n"
+                    f"  input schema: {json.dumps(mcp_tool.tool_spec['inputSchema'].get('json', {}))}"
+                    for name, mcp_tool in mcp_tools.items()
+                )
+            
+            if tool_name not in mcp_tools:
+                return f"Unknown tool '{tool_name}'. Available tools: {', '.join(mcp_tools)}"
+            
+            result = client.call_tool_sync(
+                tool_use_id=f"{proxy_name}-{uuid.uuid4().hex}",
+                name=tool_name,
+                arguments=arguments or {}
+            )
+            text = "\n".join(block["text"] for block in result["content"] if "text" in block)
+            if result["status"] == "error":
+                return f"Error from {tool_name}: {text}"
+            return text
+        
+        return server_proxy
     
-    def enter_contexts(self, stack: ExitStack) -> bool:
+    def _load_servers(self, server_configs: List[Dict]) -> Tuple[List, List[ToolInfoEntry], List]:
         """
-        Enter all MCP client contexts using the provided ExitStack.
+        Load tools from specified server configurations.
         
-        Args:
-            stack: ExitStack to manage contexts
+        Servers are started concurrently so total startup time is bounded by the
+        slowest server rather than the sum of all of them. Status is reported as
+        each server finishes, while results are applied in configuration order
+        to keep tool listings stable between runs.
+        """
+        if not server_configs:
+            return self.tools, self.tool_info, self.clients
+        
+        # Per-server (client, tools, tool_info) results, in configuration order
+        results: List[Optional[Tuple[Any, List, List[ToolInfoEntry]]]] = [None] * len(server_configs)
+        
+        with ThreadPoolExecutor(max_workers=len(server_configs)) as executor:
+            future_to_index = {
+                executor.submit(self._load_one_server, server_config): index
+                for index, server_config in enumerate(server_configs)
+            }
             
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                server_config = server_configs[index]
+                # Collect this server's status lines and emit them in one write
+                status = io.StringIO()
+                try:
+                    results[index] = future.result()
+                except ConnectionError as e:
+                    print(f"⚠️  Connection Error: Could not connect to {server_config['name']}: {e}", file=status)
+                except ImportError as e:
+                    print(f"⚠️  Import Error: Missing dependency for {server_config['name']}: {e}", file=status)
+                    self._print_installation_help(status)
+                except Exception as e:
+                    print(f"⚠️  Warning: Could not load {server_config['name']} tools: {e}", file=status)
+                else:
+                    print(f"📋 {server_config['name']} loaded {len(results[index][1])} tools", file=status)
+                    print(f"✅ {server_config['name']} MCP server tools loaded successfully", file=status)
+                
+                sys.stdout.write(status.getvalue())
+        
+        loaded = [result for result in results if result is not None]
+        
+        # Keep clients for runtime usage and flatten per-server results in one pass each
+        self.clients.extend(client for client, _, _ in loaded)
+        self.tools.extend(chain.from_iterable(mcp_tools for _, mcp_tools, _ in loaded))
+        self.tool_info.extend(chain.from_iterable(tool_info for _, _, tool_info in loaded))
+        return self.tools, self.tool_info, self.clients
+    
+    def _load_one_server(self, server_config: Dict) -> Tuple[Any, List, List[ToolInfoEntry]]:
+        """
+        Connect to a single MCP server and list its tools.
+        
+        A tool catalog cached by a previous run is used when available, which
+        skips spawning the server just to discover its tools; catalogs older
+        than MCP_TOOL_CACHE_MAX_AGE_SECONDS are revalidated in the background.
+        Runs in a worker thread, so it only returns results and leaves all
+        shared state and console output to the caller.
+        
+        Returns:
+            Tuple of (client, tools, tool_info)
+        """
+        cache_key = tool_cache_key(server_config)
+        client = create_mcp_client(
+            server_config["command"], 
+            server_config["args"],
+            server_config.get("env"),
+            lazy=not server_config.get("warm", False),
+            disk_cache_key=cache_key
+        )
+        
+        mcp_tools = load_cached_tools(cache_key, client)
+        
+        if mcp_tools is not None:
+            # Serve the cached catalog now; an old one is re-verified in the
+            # background and rewritten on disk for the next run
+            if client.cache_age_seconds >= MCP_TOOL_CACHE_MAX_AGE_SECONDS:
+                client.revalidate()
+        else:
+            # Get tools from the MCP server within context manager; the client
+            # persists the catalog for the next run
+            with client:
+                mcp_tools = client.list_tools_sync()
+        
+        # Store tool information for display
+        server_name = server_config['name']
+        tool_info = []
+        for tool in mcp_tools:
+            info = get_tool_info(tool)
+            tool_info.append(ToolInfoEntry.create(server_name, info['name'], info['description']))
+        
+        return client, mcp_tools, tool_info
+    
+    def _print_installation_help(self, file: TextIO = sys.stdout):
+        """Print installation help for MCP dependencies."""
+        print("📝 To enable MCP servers:", file=file)
+        print("   1. Install uv: curl -LsSf https://astral.sh/uv/install.sh | sh", file=file)
+        print("   2. Ensure uvx is in your PATH", file=file)
+    
+    def enter_contexts(self) -> bool:
+        """
+        Enter all MCP client contexts.
+        
+        Clients are entered in order and must be released with
+        exit_contexts(). If any client fails to enter, the ones already
+        entered are exited again before returning.
+        
         Returns:
             True if all contexts entered successfully, False otherwise
         """
@@ -101,10 +251,59 @@ class MCPManager:
         
         for i, client in enumerate(self.clients):
             try:
-                stack.enter_context(client)
-                print(f"✅ MCP client {i+1} context entered successfully")
+                client.__enter__()
             except Exception as e:
                 print(f"❌ Failed to enter MCP client {i+1} context: {e}")
+                self.exit_contexts()
                 return False
+            
+            self._entered_clients.append(client)
+            if getattr(client, 'lazy', False):
+                print(f"⏳ MCP client {i+1} will start on first tool use")
+            else:
+                print(f"✅ MCP client {i+1} context entered successfully")
+        
+        return True
+    
+    def exit_contexts(self) -> None:
+        """Exit the client contexts entered by enter_contexts(), in reverse order."""
+        while self._entered_clients:
+            client = self._entered_clients.pop()
+            try:
+                client.__exit__(None, None, None)
+            except Exception as e:
+                mcp_logger.warning(f"Error while stopping MCP client: {e}")
+    
+    def start_background_refresh(self, interval_seconds: int = MCP_TOOLS_CACHE_TTL_SECONDS) -> None:
+        """
+        Periodically re-discover tools of running MCP servers in the background.
         
-        return True
\ No newline at end of file
+        Refreshing keeps each client's tool cache and the on-disk catalog
+        current while the CLI waits for user input. Servers that have not been
+        started are left alone, so lazy servers are never spawned by this.
+        
+        Args:
+            interval_seconds: Delay between refresh rounds
+        """
+        if self._refresh_stop is not None or not self.clients or interval_seconds <= 0:
+            return
+        
+        stop = self._refresh_stop = threading.Event()
+        
+        def refresh_loop() -> None:
+            while not stop.wait(interval_seconds):
+                for client in self.clients:
+                    if not getattr(client, 'is_running', False):
+                        continue
+                    try:
+                        client.list_tools_sync(force_refresh=True)
+                    except Exception as e:
+                        mcp_logger.debug(f"Background tool refresh failed: {e}")
+        
+        threading.Thread(target=refresh_loop, name="mcp-tool-refresh", daemon=True).start()
+    
+    def stop_background_refresh(self) -> None:
+        """Stop the background refresh started by start_background_refresh()."""
+        if self._refresh_stop is not None:
+            self._refresh_stop.set()
+            self._refresh_stop = None
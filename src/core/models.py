@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Bedrock model construction shared by the agents.
+"""
+
+import functools
+import logging
+from typing import TYPE_CHECKING
+
+from config.config import (
+    LATENCY_OPTIMIZED_MODEL_PREFIXES, get_bedrock_client_config, get_boto_session
+)
+
+if TYPE_CHECKING:
+    from strands.models.bedrock import BedrockModel
+
+logger = logging.getLogger(__name__)
+
+
+def supports_latency_optimized(model_id: str) -> bool:
+    """Return whether Bedrock offers latency-optimized inference for the model."""
+    return model_id.startswith(LATENCY_OPTIMIZED_MODEL_PREFIXES)
+
+
+@functools.cache
+def _latency_optimized_model_class() -> type:
+    """Define the latency-optimized model class on first use."""
+    # Deferred so importing this module does not load the Bedrock SDK
+    from botocore.exceptions import ClientError
+    from strands.models.bedrock import BedrockModel
+    
+    class LatencyOptimizedBedrockModel(BedrockModel):
+        """
+        BedrockModel that requests latency-optimized inference.
+        
+        If Bedrock rejects the performance configuration, the model switches
+        to standard inference and retries the request.
+        """
+        
+        latency_optimized = True
+        
+        def format_request(self, *args, **kwargs):
+            request = super().format_request(*args, **kwargs)
+            if self.latency_optimized:
+                request["performanceConfig"] = {"latency": "optimized"}
+            return request
+        
+        async def stream(self, *args, **kwargs):
+            started = False
+            try:
+                async for event in super().stream(*args, **kwargs):
+                    started = True
+                    yield event
+                return
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code")
+                if started or not self.latency_optimized or error_code != "ValidationException":
+                    raise
+                logger.warning(f"Latency-optimized inference rejected, using standard inference: {e}")
+            
+            self.latency_optimized = False
+            async for event in super().stream(*args, **kwargs):
+                yield event
+    
+    return LatencyOptimizedBedrockModel
+
+
+@functools.lru_cache(maxsize=4)
+def get_bedrock_model(model_id: str, temperature: float, latency_optimized: bool = False) -> 'BedrockModel':
+    """
+    Return a Bedrock model for the given settings, reusing earlier instances.
+    
+    Building a BedrockModel creates a botocore client, which loads the
+    endpoint data from disk; caching per (model_id, temperature) lets every
+    agent created in this process share one model and client. All models
+    use the process-wide boto3 session and the shared Bedrock client
+    configuration (connection pool size, adaptive retries and timeouts).
+    
+    Args:
+        model_id: Bedrock model or inference profile ID
+        temperature: Sampling temperature
+        latency_optimized: Request latency-optimized inference when the
+            model supports it
+    
+    Returns:
+        Shared BedrockModel instance
+    """
+    if latency_optimized and supports_latency_optimized(model_id):
+        model_class = _latency_optimized_model_class()
+    else:
+        # Deferred so importing this module does not load the Bedrock SDK
+        from strands.models.bedrock import BedrockModel
+        model_class = BedrockModel
+    
+    return model_class(
+        boto_session=get_boto_session(),
+        boto_client_config=get_bedrock_client_config(),
+        model_id=model_id,
+        temperature=temperature
+    )
@@ -3,35 +3,24 @@
 CLI interface utilities for AWS DevOps agent.
 """
 
-import signal
-from typing import List, Dict, Any
+import asyncio
+from collections import defaultdict
+from typing import List
 from config.config import (
     TOOL_COMMANDS, EXIT_COMMANDS, WELCOME_MESSAGE, HELP_MESSAGE,
     EXIT_MESSAGE, EMPTY_INPUT_MESSAGE, PROCESSING_MESSAGE,
     AGENT_TIMEOUT_SECONDS
 )
+from utils.mcp_utils import ToolInfoEntry
+from utils.input_utils import create_input_reader
+from utils.timeout_utils import run_with_timeout_async
 
-
-class TimeoutHandler:
-    """Context manager for handling timeouts."""
-    
-    def __init__(self, timeout_seconds: int, timeout_message: str):
-        self.timeout_seconds = timeout_seconds
-        self.timeout_message = timeout_message
-        self.old_handler = None
-    
-    def __enter__(self):
-        def timeout_handler(signum, frame):
-            raise TimeoutError(self.timeout_message)
-        
-        self.old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(self.timeout_seconds)
-        return self
-    
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        signal.alarm(0)  # Cancel timeout
-        if self.old_handler:
-            signal.signal(signal.SIGALRM, self.old_handler)
+# Section headings for the tools listing, keyed by MCP server name
+TOOL_SECTION_HEADINGS = {
+    "AWS Documentation": "📚 AWS Documentation Tools",
+    "AWS Knowledge": "🧠 AWS Knowledge Tools",
+    "AWS EKS": "☸️  AWS EKS Tools",
+}
 
 
 def display_welcome():
@@ -40,90 +29,104 @@ def display_welcome():
     print(HELP_MESSAGE)
 
 
-def display_tools_info(tools_count: int, mcp_tool_info: List[Dict[str, Any]]):
-    """Display available tools information."""
-    print(f"\n🛠️  Available Tools ({tools_count} total):")
-    print("=" * 60)
-    
-    # Show websearch tool first
-    print("\n🔍 Web Search Tools:")
-    print("  1. websearch - Search the web to get updated information quickly")
-    
-    # Group MCP tools by server
-    aws_doc_tools = []
-    aws_knowledge_tools = []
-    aws_eks_tools = []
-    
+def render_tools_info(tools_count: int, mcp_tool_info: List[ToolInfoEntry]) -> str:
+    """Render the available tools listing as a single block of text."""
+    lines = [
+        f"\n🛠️  Available Tools ({tools_count} total):",
+        "=" * 60,
+        # Show websearch tool first
+        "\n🔍 Web Search Tools:",
+        "  1. websearch - Search the web to get updated information quickly",
+    ]
+    
+    # Group pre-rendered MCP tool entries by server
+    tools_by_server = defaultdict(list)
     for tool_info in mcp_tool_info:
-        server = tool_info['server']
-        name = tool_info['name']
-        desc = tool_info['description']
-        
-        # Truncate long descriptions
-        if len(desc) > 80:
-            desc = desc[:77] + "..."
-        
-        tool_entry = f"  • {name} - {desc}"
-        
-        if 'Documentation' in server:
-            aws_doc_tools.append(tool_entry)
-        elif 'Knowledge' in server:
-            aws_knowledge_tools.append(tool_entry)
-        elif 'EKS' in server:
-            aws_eks_tools.append(tool_entry)
-    
-    # Display MCP tools by category
-    if aws_doc_tools:
-        print(f"\n📚 AWS Documentation Tools ({len(aws_doc_tools)} tools):")
-        for tool in aws_doc_tools:
-            print(tool)
-    
-    if aws_knowledge_tools:
-        print(f"\n🧠 AWS Knowledge Tools ({len(aws_knowledge_tools)} tools):")
-        for tool in aws_knowledge_tools:
-            print(tool)
-    
-    if aws_eks_tools:
-        print(f"\n☸️  AWS EKS Tools ({len(aws_eks_tools)} tools):")
-        for tool in aws_eks_tools:
-            print(tool)
-    
-    print("\n💡 You can ask me to use any of these tools or just ask questions naturally!")
-    print("🎯 Example: 'Use AWS Documentation to find S3 pricing' or 'List my EKS clusters'")
+        tools_by_server[tool_info.server].append(tool_info.rendered)
+    
+    # List MCP tools by server in a fixed order, then any unknown servers
+    sections = [
+        (heading, tools_by_server.pop(server, None))
+        for server, heading in TOOL_SECTION_HEADINGS.items()
+    ]
+    sections.extend(
+        (f"🔧 {server} Tools", server_tools)
+        for server, server_tools in tools_by_server.items()
+    )
+    for heading, server_tools in sections:
+        if server_tools:
+            lines.append(f"\n{heading} ({len(server_tools)} tools):")
+            lines.extend(server_tools)
+    
+    lines.append("\n💡 You can ask me to use any of these tools or just ask questions naturally!")
+    lines.append("🎯 Example: 'Use AWS Documentation to find S3 pricing' or 'List my EKS clusters'")
+    return "\n".join(lines)
 
 
-def handle_user_input(user_input: str, agent: 'Agent', tools_count: int, mcp_tool_info: List[Dict[str, Any]]) -> bool:
+def render_fallback_tools_info(tools_count: int) -> str:
+    """Render the tools listing used when MCP servers are unavailable."""
+    return "\n".join([
+        f"\n🛠️  Available Tools ({tools_count} total):",
+        "=" * 50,
+        "\n🔍 Web Search Tools:",
+        "  1. websearch - Search the web to get updated information quickly.",
+        "\n⚠️  Note: MCP servers (AWS Documentation, Knowledge, EKS) are not available.",
+        "💡 You can still ask me AWS DevOps questions and I'll help with my built-in knowledge!",
+    ])
+
+
+def display_tools_info(tools_count: int, mcp_tool_info: List[ToolInfoEntry]):
+    """Display available tools information."""
+    print(render_tools_info(tools_count, mcp_tool_info))
+
+
+def display_fallback_tools_info(tools_count: int):
+    """Display available tools information when MCP servers are unavailable."""
+    print(render_fallback_tools_info(tools_count))
+
+
+def handle_user_input(user_input: str, agent: 'Agent', tools_listing: str) -> bool:
     """
     Handle user input and return whether to continue the loop.
     
+    Args:
+        user_input: Raw line entered by the user
+        agent: The configured agent instance
+        tools_listing: Pre-rendered text shown for the tools command
+    
     Returns:
         bool: True to continue, False to exit
     """
+    command = user_input.strip().lower()
+    
     # Check for exit commands
-    if user_input.lower() in EXIT_COMMANDS:
+    if command in EXIT_COMMANDS:
         print(EXIT_MESSAGE)
         return False
     
     # Check for empty input
-    if not user_input.strip():
+    if not command:
         print(EMPTY_INPUT_MESSAGE)
         return True
     
     # Check for tools command
-    if user_input.lower() in TOOL_COMMANDS:
-        display_tools_info(tools_count, mcp_tool_info)
+    if command in TOOL_COMMANDS:
+        print(tools_listing)
         return True
     
-    # Process agent request with timeout
+    # Process agent request with timeout. The request is cancelled when it
+    # times out: left running, it would keep the agent busy and strands would
+    # reject every following prompt until it finished.
     try:
-        with TimeoutHandler(AGENT_TIMEOUT_SECONDS, "Agent response timeout"):
-            print(PROCESSING_MESSAGE)
-            response = agent(user_input)
-            # Handle AgentResult object properly
-            if hasattr(response, 'content'):
-                print(f"\nAWS-DevOps-bot > {response.content}")
-            else:
-                print(f"\nAWS-DevOps-bot > {response}")
+        print(PROCESSING_MESSAGE)
+        response = asyncio.run(run_with_timeout_async(
+            agent.invoke_async(user_input), AGENT_TIMEOUT_SECONDS, message="Agent response timeout"
+        ))
+        # Handle AgentResult object properly
+        if hasattr(response, 'content'):
+            print(f"\nAWS-DevOps-bot > {response.content}")
+        else:
+            print(f"\nAWS-DevOps-bot > {response}")
     except TimeoutError:
         print(f"\nAWS-DevOps-bot > I apologize, but that request took too long to process. "
               f"Let me provide a quick response based on my knowledge instead.")
@@ -134,7 +137,7 @@ def handle_user_input(user_input: str, agent: 'Agent', tools_count: int, mcp_too
     return True
 
 
-def run_interactive_loop(agent: 'Agent', tools_count: int, mcp_tool_info: List[Dict[str, Any]]) -> None:
+def run_interactive_loop(agent: 'Agent', tools_count: int, mcp_tool_info: List[ToolInfoEntry]) -> None:
     """
     Run the main interactive CLI loop with MCP tools available.
     
@@ -145,9 +148,17 @@ def run_interactive_loop(agent: 'Agent', tools_count: int, mcp_tool_info: List[D
     """
     display_welcome()
     
+    # The tools listing only depends on what was discovered at startup
+    if mcp_tool_info:
+        tools_listing = render_tools_info(tools_count, mcp_tool_info)
+    else:
+        tools_listing = render_fallback_tools_info(tools_count)
+    
+    read_input = create_input_reader(EXIT_COMMANDS | TOOL_COMMANDS)
+    
     while True:
-        user_input = input("\nYou > ")
-        should_continue = handle_user_input(user_input, agent, tools_count, mcp_tool_info)
+        user_input = read_input("\nYou > ")
+        should_continue = handle_user_input(user_input, agent, tools_listing)
         if not should_continue:
             break
 
@@ -160,44 +171,4 @@ def run_fallback_loop(agent: 'Agent', tools_count: int) -> None:
         agent: The configured agent instance
         tools_count: Total number of available tools (should be 1 for websearch only)
     """
-    display_welcome()
-    
-    while True:
-        user_input = input("\nYou > ")
-        
-        # Check for exit commands
-        if user_input.lower() in EXIT_COMMANDS:
-            print(EXIT_MESSAGE)
-            break
-        
-        # Check for empty input
-        if not user_input.strip():
-            print(EMPTY_INPUT_MESSAGE)
-            continue
-        
-        # Check for tools command
-        if user_input.lower() in TOOL_COMMANDS:
-            print(f"\n🛠️  Available Tools ({tools_count} total):")
-            print("=" * 50)
-            print("\n🔍 Web Search Tools:")
-            print("  1. websearch - Search the web to get updated information quickly.")
-            print("\n⚠️  Note: MCP servers (AWS Documentation, Knowledge, EKS) are not available.")
-            print("💡 You can still ask me AWS DevOps questions and I'll help with my built-in knowledge!")
-            continue
-        
-        # Process agent request with timeout
-        try:
-            with TimeoutHandler(AGENT_TIMEOUT_SECONDS, "Agent response timeout"):
-                print(PROCESSING_MESSAGE)
-                response = agent(user_input)
-                # Handle AgentResult object properly
-                if hasattr(response, 'content'):
-                    print(f"\nAWS-DevOps-bot > {response.content}")
-                else:
-                    print(f"\nAWS-DevOps-bot > {response}")
-        except TimeoutError:
-            print(f"\nAWS-DevOps-bot > I apologize, but that request took too long to process. "
-                  f"Let me provide a quick response based on my knowledge instead.")
-        except Exception as e:
-            print(f"\nAWS-DevOps-bot > I encountered an error: {e}. "
-                  f"Let me help you with general AWS DevOps guidance instead.")
\ No newline at end of file
+    run_interactive_loop(agent, tools_count, [])
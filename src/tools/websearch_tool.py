@@ -1,15 +1,348 @@
 #!/usr/bin/env python3
 """
 Web search tool using DuckDuckGo with timeout protection.
+
+websearch is the synchronous tool the agents register; websearch_async is the
+same search for agents running tools on an event loop. Both share the result
+caches, rate limiter, search slots and in-flight searches.
 """
 
-import signal
-from ddgs import DDGS
-from ddgs.exceptions import DDGSException, RatelimitException
+import asyncio
+import functools
+import logging
+import random
+import threading
+import time
+from concurrent.futures import (
+    Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+)
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, Optional, Tuple
 from strands.tools import tool
-from config.config import SEARCH_TIMEOUT_SECONDS, DEFAULT_MAX_SEARCH_RESULTS, MAX_SEARCH_RESULTS_LIMIT
+from config.config import (
+    SEARCH_TIMEOUT_SECONDS, DEFAULT_MAX_SEARCH_RESULTS, MAX_SEARCH_RESULTS_LIMIT,
+    SEARCH_CACHE_TTL_MIN_SECONDS, SEARCH_CACHE_TTL_MAX_SECONDS,
+    SEARCH_CACHE_MAX_ENTRIES, SEARCH_NEGATIVE_CACHE_TTL_SECONDS,
+    SEARCH_NEGATIVE_CACHE_MAX_ENTRIES, SEARCH_REQUESTS_PER_SECOND, SEARCH_MIN_REQUESTS_PER_SECOND,
+    SEARCH_MAX_REQUESTS_PER_SECOND, SEARCH_BURST,
+    SEARCH_CONCURRENCY, SEARCH_MAX_RETRIES, SEARCH_MAX_BACKOFF_SECONDS
+)
+from utils.cache_utils import TTLCache
+from utils.rate_limit_utils import AdaptiveTokenBucket
+
+logger = logging.getLogger(__name__)
+
+_TIMEOUT_MESSAGE = "Search timeout - please try a more specific query."
+_RATE_LIMIT_MESSAGE = "Rate limit reached - please try again in a moment."
+_NO_RESULTS_MESSAGE = "No results found."
+
+# Searches run in worker threads so the timeout works regardless of which
+# thread the agent invokes the tool from
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=SEARCH_CONCURRENCY, thread_name_prefix="websearch")
+# One slot per worker, taken before submitting and released when the search
+# finishes. Callers wait here instead of queueing in the executor, so a call
+# that times out never leaves a search behind to run later for nobody.
+_SEARCH_SLOTS = threading.BoundedSemaphore(SEARCH_CONCURRENCY)
+
+# Searches currently running, by cache key. Callers asking for a query that
+# is already in flight wait for that search instead of starting another.
+_INFLIGHT: Dict[Hashable, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# One DDGS client per worker thread, reused across searches so its HTTP
+# session and connection pool survive between calls
+_thread_local = threading.local()
+
+# Formatted successful results keyed by (normalized keywords, region,
+# max_results)
+_RESULT_CACHE: TTLCache[str] = TTLCache(SEARCH_CACHE_MAX_ENTRIES, SEARCH_CACHE_TTL_MAX_SECONDS)
+# Messages for empty results and search service errors under the same keys,
+# kept only briefly. Rate limits and timeouts are never cached here.
+_NEGATIVE_CACHE: TTLCache[str] = TTLCache(
+    SEARCH_NEGATIVE_CACHE_MAX_ENTRIES, SEARCH_NEGATIVE_CACHE_TTL_SECONDS
+)
+
+# Shared by all callers so concurrent tool calls respect one rate limit,
+# which adapts to the rate limit responses DuckDuckGo sends back
+_RATE_LIMITER = AdaptiveTokenBucket(
+    SEARCH_REQUESTS_PER_SECOND,
+    SEARCH_BURST,
+    min_rate=SEARCH_MIN_REQUESTS_PER_SECOND,
+    max_rate=SEARCH_MAX_REQUESTS_PER_SECOND
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResult:
+    """One web search result."""
+    
+    title: str
+    href: str
+    body: str
+    
+    @classmethod
+    def from_dict(cls, result: Dict[str, str]) -> "SearchResult":
+        """Build a result from a DDGS result dict."""
+        return cls(result.get('title', ''), result.get('href', ''), result.get('body', ''))
+
+
+def _format_results(results: Tuple[SearchResult, ...]) -> str:
+    """Format search results as a compact numbered list of title, URL and snippet."""
+    return "\n".join(
+        f"{i}. {r.title}\n   {r.href}\n   {r.body}" for i, r in enumerate(results, 1)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _SearchRequest:
+    """One tool call's search, with its cache key and time budget."""
+    
+    keywords: str
+    region: str
+    max_results: int
+    cache_key: Hashable
+    # time.monotonic() value after which the caller stops waiting
+    deadline: float
+
+
+class _SearchThrottled(Exception):
+    """No rate limit token became available before the caller's deadline."""
+
+
+def _claim_search(cache_key: Hashable) -> Tuple[Future, bool]:
+    """
+    Return the in-flight search for cache_key, registering a new one if needed.
+    
+    Returns:
+        The search's future, and whether the caller registered it and so
+        must start it with _start_search
+    """
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(cache_key)
+        if future is not None:
+            return future, False
+        future = _INFLIGHT[cache_key] = Future()
+        # Running futures cannot be cancelled, so a caller giving up never
+        # takes the search away from the others waiting on it
+        future.set_running_or_notify_cancel()
+        return future, True
+
+
+def _start_search(future: Future, request: _SearchRequest) -> None:
+    """
+    Run a claimed search once a rate limit token and a search slot are free.
+    
+    Waits for both together no longer than until deadline; if either is not
+    available in time, the search fails for every caller waiting on it. The
+    slot is released when the search finishes.
+    """
+    cache_key = request.cache_key
+    if not _RATE_LIMITER.acquire(timeout=_remaining(request.deadline)):
+        _fail_search(future, cache_key, _SearchThrottled())
+        return
+    if not _SEARCH_SLOTS.acquire(timeout=_remaining(request.deadline)):
+        _fail_search(future, cache_key, TimeoutError())
+        return
+    
+    logger.info("Searching for: %s", request.keywords)
+    try:
+        search = _SEARCH_EXECUTOR.submit(
+            _search, request.keywords, request.region, request.max_results, request.deadline
+        )
+    except Exception as e:
+        _SEARCH_SLOTS.release()
+        _fail_search(future, cache_key, e)
+        return
+    search.add_done_callback(functools.partial(_finish_search, future, cache_key))
+
+
+def _fail_search(future: Future, cache_key: Hashable, error: Exception) -> None:
+    """Fail a claimed search that never started."""
+    _forget_search(future, cache_key)
+    future.set_exception(error)
+
+
+def _finish_search(future: Future, cache_key: Hashable, search: Future) -> None:
+    """Free the slot held by a finished search and pass its outcome to the callers."""
+    _forget_search(future, cache_key)
+    _SEARCH_SLOTS.release()
+    error = search.exception()
+    if error is None:
+        future.set_result(search.result())
+    else:
+        future.set_exception(error)
+
+
+def _forget_search(future: Future, cache_key: Hashable) -> None:
+    """Stop offering a search to new callers."""
+    with _INFLIGHT_LOCK:
+        if _INFLIGHT.get(cache_key) is future:
+            del _INFLIGHT[cache_key]
+
+
+def _cache_ttl() -> float:
+    """Return a jittered time to live for a new search cache entry."""
+    return random.uniform(SEARCH_CACHE_TTL_MIN_SECONDS, SEARCH_CACHE_TTL_MAX_SECONDS)
+
+
+def _get_ddgs() -> 'DDGS':
+    """Return the calling thread's DDGS client, creating it on first use."""
+    ddgs = getattr(_thread_local, 'ddgs', None)
+    if ddgs is None:
+        # Imported lazily: ddgs pulls in its HTTP stack, which sessions that
+        # never search should not pay for at startup
+        from ddgs import DDGS
+        # The HTTP requests time out on their own; the executor timeout in
+        # websearch() only bounds the search as a whole
+        ddgs = _thread_local.ddgs = DDGS(timeout=SEARCH_TIMEOUT_SECONDS)
+    return ddgs
+
+
+def _search_once(keywords: str, region: str, max_results: int) -> Tuple[SearchResult, ...]:
+    """Run a text search with the calling thread's DDGS client."""
+    from ddgs.exceptions import DDGSException, RatelimitException
+    
+    try:
+        results = _get_ddgs().text(keywords, region=region, max_results=max_results)
+    except RatelimitException:
+        _RATE_LIMITER.on_rate_limited()
+        raise
+    except DDGSException:
+        # The client's cached engine sessions may be broken; the thread's next
+        # search builds a fresh client
+        _thread_local.ddgs = None
+        raise
+    
+    _RATE_LIMITER.on_success()
+    # Immutable, so searches joined by several callers can share the results
+    return tuple(map(SearchResult.from_dict, results))
+
+
+def _backoff_seconds(attempt: int) -> float:
+    """Return a fully jittered exponential backoff delay for a retry."""
+    return random.uniform(0, min(SEARCH_MAX_BACKOFF_SECONDS, 0.5 * 2 ** attempt))
+
+
+def _search(
+    keywords: str, region: str, max_results: int, deadline: float
+) -> Tuple[SearchResult, ...]:
+    """
+    Run a text search, retrying rate limits and transient service errors.
+    
+    Retries respect the rate limiter and stop at deadline (a time.monotonic()
+    value), after which the caller no longer waits for the result. Timeouts
+    are not retried: the caller has already spent its time budget.
+    """
+    from ddgs.exceptions import DDGSException, TimeoutException
+    
+    for attempt in range(SEARCH_MAX_RETRIES + 1):
+        try:
+            return _search_once(keywords, region, max_results)
+        except TimeoutException:
+            raise
+        except DDGSException:
+            if attempt == SEARCH_MAX_RETRIES:
+                raise
+            delay = _backoff_seconds(attempt)
+            if time.monotonic() + delay >= deadline:
+                raise
+            time.sleep(delay)
+            if not _RATE_LIMITER.acquire(timeout=deadline - time.monotonic()):
+                raise
+
+
+def _cache_key(keywords: str, region: str, max_results: int) -> Tuple[str, str, int]:
+    """Return the cache and in-flight key for a search."""
+    # Queries differing only in case or spacing share one cache entry; the
+    # search itself uses the keywords as given
+    return (" ".join(keywords.lower().split()), region, max_results)
+
+
+def _cached_response(cache_key: Hashable) -> Optional[str]:
+    """Return the cached response for a search, if there is one."""
+    message = _NEGATIVE_CACHE.get(cache_key)
+    if message is not None:
+        return message
+    return _RESULT_CACHE.get(cache_key)
+
+
+def _remaining(deadline: float) -> float:
+    """Return the seconds left until deadline, a time.monotonic() value."""
+    return max(0.0, deadline - time.monotonic())
+
+
+def _get_or_start_search(request: _SearchRequest) -> Future:
+    """
+    Return the in-flight search for a request, starting one if there is none.
+    
+    Joining a running search is free: only the caller that starts a search
+    waits for a rate limit token and a search slot.
+    """
+    search, claimed = _claim_search(request.cache_key)
+    if claimed:
+        _start_search(search, request)
+    return search
+
+
+def _complete_search(cache_key: Hashable, results: Tuple[SearchResult, ...]) -> str:
+    """Format and cache the results of a finished search."""
+    if not results:
+        _NEGATIVE_CACHE.set(cache_key, _NO_RESULTS_MESSAGE)
+        return _NO_RESULTS_MESSAGE
+    
+    logger.info("Found %d results", len(results))
+    formatted = _format_results(results)
+    _RESULT_CACHE.set(cache_key, formatted, _cache_ttl())
+    return formatted
+
+
+def _error_response(cache_key: Hashable, error: Exception) -> str:
+    """Turn a failed search into a message for the agent."""
+    from ddgs.exceptions import DDGSException, RatelimitException, TimeoutException
+    
+    if isinstance(error, (TimeoutError, FuturesTimeoutError, asyncio.TimeoutError, TimeoutException)):
+        return _TIMEOUT_MESSAGE
+    if isinstance(error, (_SearchThrottled, RatelimitException)):
+        return _RATE_LIMIT_MESSAGE
+    if isinstance(error, DDGSException):
+        message = f"Search service error: {error}"
+        _NEGATIVE_CACHE.set(cache_key, message)
+        return message
+    return f"Search failed: {error}"
+
+
+def _prepare_search(
+    keywords: str, region: str, max_results: Optional[int]
+) -> Tuple[_SearchRequest, Optional[str]]:
+    """
+    Start a tool call's time budget and look its search up in the caches.
+    
+    Returns:
+        The search request, and the cached response if there is one
+    """
+    # One time budget for waiting on a token, a slot and the results
+    deadline = time.monotonic() + SEARCH_TIMEOUT_SECONDS
+    # Limit results for faster responses
+    max_results = min(max_results or DEFAULT_MAX_SEARCH_RESULTS, MAX_SEARCH_RESULTS_LIMIT)
+    cache_key = _cache_key(keywords, region, max_results)
+    request = _SearchRequest(keywords, region, max_results, cache_key, deadline)
+    return request, _cached_response(cache_key)
 
 
+def _websearch(keywords: str, region: str, max_results: Optional[int]) -> str:
+    """Run a search through the caches, rate limiter and search slots."""
+    request, response = _prepare_search(keywords, region, max_results)
+    if response is not None:
+        return response
+    
+    try:
+        search = _get_or_start_search(request)
+        return _complete_search(
+            request.cache_key, search.result(timeout=_remaining(request.deadline))
+        )
+    except Exception as e:
+        return _error_response(request.cache_key, e)
+
 @tool
 def websearch(
     keywords: str, region: str = "us-en", max_results: int | None = DEFAULT_MAX_SEARCH_RESULTS
@@ -20,40 +353,84 @@ def websearch(
         region (str): The search region: wt-wt, us-en, uk-en, ru-ru, etc..
         max_results (int | None): The maximum number of results to return (default: 3 for speed).
     Returns:
-        List of dictionaries with search results.
+        Numbered search results (title, URL and snippet each), or a message
+        explaining why there are none.
+    """
+    return _websearch(keywords, region, max_results)
+
+
+@tool
+async def websearch_async(
+    keywords: str, region: str = "us-en", max_results: int | None = DEFAULT_MAX_SEARCH_RESULTS
+) -> str:
+    """Search the web to get updated information quickly, without blocking the event loop.
+    Args:
+        keywords (str): The search query keywords.
+        region (str): The search region: wt-wt, us-en, uk-en, ru-ru, etc..
+        max_results (int | None): The maximum number of results to return (default: 3 for speed).
+    Returns:
+        Numbered search results (title, URL and snippet each), or a message
+        explaining why there are none.
     """
-    def timeout_handler(signum, frame):
-        raise TimeoutError(f"Search timeout after {SEARCH_TIMEOUT_SECONDS} seconds")
+    # Cache hits and joins are handled on the event loop without a thread hop
+    request, response = _prepare_search(keywords, region, max_results)
+    if response is not None:
+        return response
     
     try:
-        # Set timeout for search operation
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(SEARCH_TIMEOUT_SECONDS)
-        
-        # Limit results for faster responses
-        if max_results is None or max_results > MAX_SEARCH_RESULTS_LIMIT:
-            max_results = DEFAULT_MAX_SEARCH_RESULTS
-            
-        print(f"🔍 Searching for: {keywords}")
-        results = DDGS().text(keywords, region=region, max_results=max_results)
-        
-        # Cancel timeout
-        signal.alarm(0)
-        
-        if results:
-            print(f"✅ Found {len(results)} results")
-            return results
-        else:
-            return "No results found."
-            
-    except TimeoutError:
-        signal.alarm(0)
-        return "Search timeout - please try a more specific query."
-    except RatelimitException:
-        return "Rate limit reached - please try again in a moment."
-    except DDGSException as d:
-        return f"Search service error: {d}"
+        search, claimed = _claim_search(request.cache_key)
+        if claimed:
+            # Waiting for a rate limit token or a search slot blocks, so it
+            # happens in a worker thread. Shielded: the claimed search must
+            # start or fail even if this call is cancelled, or the callers
+            # joining it would wait for nothing.
+            await asyncio.shield(asyncio.to_thread(_start_search, search, request))
+        # Shielded: timing out must not cancel a search other callers joined
+        results = await asyncio.wait_for(
+            asyncio.shield(asyncio.wrap_future(search)), _remaining(request.deadline)
+        )
+        return _complete_search(request.cache_key, results)
     except Exception as e:
-        return f"Search failed: {e}"
-    finally:
-        signal.alarm(0)  # Ensure timeout is always cancelled
\ No newline at end of file
+        return _error_response(request.cache_key, e)
+
+
+def _warm_query(query: str, region: str, max_results: int) -> None:
+    """Cache one query's results, raising if the search fails."""
+    request, response = _prepare_search(query, region, max_results)
+    if response is None:
+        search = _get_or_start_search(request)
+        _complete_search(request.cache_key, search.result(timeout=_remaining(request.deadline)))
+
+
+def warm_cache(
+    queries: Iterable[str], region: str = "us-en", max_results: int = DEFAULT_MAX_SEARCH_RESULTS
+) -> int:
+    """
+    Pre-populate the search cache, e.g. with predictable first-turn queries.
+    
+    The queries run concurrently but go through the same rate limiter and
+    search slots as the tool, so warming never exceeds the search limits.
+    
+    Args:
+        queries: Search queries to cache
+        region: Search region the queries will be asked for
+        max_results: Result count the queries will be asked for
+        
+    Returns:
+        Number of queries whose results are now cached
+    """
+    warmed = 0
+    with ThreadPoolExecutor(max_workers=SEARCH_CONCURRENCY, thread_name_prefix="websearch-warmup") as executor:
+        searches = {
+            executor.submit(_warm_query, query, region, max_results): query for query in queries
+        }
+        for search in as_completed(searches):
+            query = searches[search]
+            try:
+                search.result()
+            except Exception as e:
+                logger.warning("Search cache warmup failed for %r: %s", query, e)
+            else:
+                warmed += 1
+                logger.debug("Search cache warmed for %r", query)
+    return warmed
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Event loop utilities for AWS DevOps agent.
+"""
+
+import asyncio
+import functools
+
+
+@functools.cache
+def install_uvloop() -> bool:
+    """
+    Make asyncio use uvloop's event loop when uvloop is installed.
+    
+    Affects event loops created afterwards, e.g. by asyncio.run(). Safe to
+    call more than once.
+    
+    Returns:
+        True if uvloop is in use, False if it is not installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
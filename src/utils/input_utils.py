@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Interactive input utilities for AWS DevOps agent.
+"""
+
+from typing import Callable, Iterable
+
+
+def create_input_reader(commands: Iterable[str] = ()) -> Callable[[str], str]:
+    """
+    Return a function that reads one line of user input.
+    
+    Uses prompt_toolkit when it is installed, which adds in-session history,
+    line editing and completion of the given commands. Falls back to the
+    builtin input() otherwise. Both raise EOFError and KeyboardInterrupt the
+    same way.
+    
+    Args:
+        commands: Words to offer as completions, e.g. exit and tools commands
+        
+    Returns:
+        Callable taking the prompt text and returning the entered line
+    """
+    try:
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.completion import WordCompleter
+    except ImportError:
+        return input
+    
+    session = PromptSession(completer=WordCompleter(sorted(commands), ignore_case=True))
+    return session.prompt
@@ -3,17 +3,232 @@
 MCP utility functions for AWS DevOps agent.
 """
 
+import asyncio
+import atexit
+import functools
+import hashlib
+import json
 import os
-from typing import List, Dict, Any, Optional
+import shutil
+import textwrap
+import threading
+from dataclasses import dataclass
+from time import monotonic, time
+from typing import List, Dict, Any, Optional, Tuple
 from mcp import stdio_client, StdioServerParameters
-from strands.tools.mcp import MCPClient
+from mcp.types import Tool as MCPTool
+from strands.tools.mcp import MCPAgentTool, MCPClient
+from config.config import (
+    MCP_SERVER_VERSIONS, MCP_STARTUP_TIMEOUT_SECONDS, MCP_TEST_CACHE_TTL_SECONDS,
+    MCP_TOOL_CACHE_DIR, MCP_TOOLS_CACHE_TTL_SECONDS
+)
 
 # Constants
 DEFAULT_DESCRIPTION_MAX_LENGTH = 100
+LISTING_DESCRIPTION_MAX_LENGTH = 80
 DESCRIPTION_TRUNCATE_SUFFIX = "..."
 
 
-def create_mcp_client(command: str, args: List[str], env: Optional[Dict[str, str]] = None) -> MCPClient:
+class CachedMCPClient(MCPClient):
+    """
+    MCP client that memoizes tool discovery with stale-while-revalidate.
+    
+    list_tools_sync() returns cached tools immediately while they are younger
+    than ``cache_ttl_seconds``. Once they are older, the stale tools are still
+    returned right away and a background thread re-fetches them, so callers
+    only wait on discovery when nothing has been cached yet. The cache
+    survives client restarts, since the tools stay bound to this client.
+    When ``disk_cache_key`` is set, every fresh catalog is also persisted
+    with save_tool_cache() for the next run.
+    """
+    
+    def __init__(
+        self,
+        *args,
+        cache_ttl_seconds: int = MCP_TOOLS_CACHE_TTL_SECONDS,
+        disk_cache_key: Optional[str] = None,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.disk_cache_key = disk_cache_key
+        self._cache_lock = threading.Lock()
+        self._cached_tools = None
+        self._last_fetch = 0.0
+        self._refreshing = False
+    
+    def list_tools_sync(
+        self, pagination_token: Optional[str] = None, force_refresh: bool = False, **kwargs
+    ):
+        """
+        List the server's tools, serving from cache whenever possible.
+        
+        Args:
+            pagination_token: Token for fetching a further page (never cached)
+            force_refresh: Bypass the cache and query the server synchronously
+            **kwargs: Further MCPClient.list_tools_sync() arguments, e.g.
+                prefix and tool_filters; listings using them are never cached
+        """
+        if pagination_token is not None or any(kwargs.values()):
+            return self._list_tools_uncached(pagination_token, **kwargs)
+        
+        if not force_refresh:
+            with self._cache_lock:
+                cached_tools = self._cached_tools
+                is_stale = (
+                    cached_tools is not None
+                    and (monotonic() - self._last_fetch) >= self.cache_ttl_seconds
+                )
+            
+            if cached_tools is not None:
+                if is_stale:
+                    self.revalidate()
+                return cached_tools
+        
+        return self._fetch_and_store()
+    
+    def prime_cache(self, tools, age_seconds: float = 0.0) -> None:
+        """
+        Seed the cache with tools discovered earlier, e.g. loaded from disk.
+        
+        Args:
+            tools: Tools bound to this client
+            age_seconds: How long ago the tools were discovered
+        """
+        with self._cache_lock:
+            self._cached_tools = tools
+            self._last_fetch = monotonic() - age_seconds
+    
+    @property
+    def cache_age_seconds(self) -> Optional[float]:
+        """Seconds since the cached tools were discovered, or None if empty."""
+        with self._cache_lock:
+            if self._cached_tools is None:
+                return None
+            return monotonic() - self._last_fetch
+    
+    def revalidate(self) -> bool:
+        """
+        Re-fetch the tools in a background thread unless already refreshing.
+        
+        Returns:
+            True if a refresh was started
+        """
+        with self._cache_lock:
+            if self._refreshing:
+                return False
+            self._refreshing = True
+        
+        threading.Thread(
+            target=self._refresh_in_background, name="mcp-list-tools", daemon=True
+        ).start()
+        return True
+    
+    def _fetch_and_store(self):
+        """Query the server and atomically replace the cached tools."""
+        tools = self._list_tools_uncached(None)
+        with self._cache_lock:
+            self._cached_tools = tools
+            self._last_fetch = monotonic()
+        
+        if self.disk_cache_key:
+            save_tool_cache(self.disk_cache_key, tools)
+        return tools
+    
+    def _refresh_in_background(self) -> None:
+        """Revalidate stale tools; on failure the stale tools keep being served."""
+        try:
+            self._fetch_and_store()
+        except Exception:
+            pass
+        finally:
+            with self._cache_lock:
+                self._refreshing = False
+    
+    def _list_tools_uncached(self, pagination_token: Optional[str], **kwargs):
+        """Query the server for its tools."""
+        return super().list_tools_sync(pagination_token, **kwargs)
+
+
+class LazyMCPClient(CachedMCPClient):
+    """
+    MCP client that spawns its server on first use.
+    
+    With ``lazy=True`` entering the client's context does not start the server;
+    it is started the first time tools are listed or called and stopped when the
+    context exits. With ``lazy=False`` the client behaves like a regular
+    MCPClient. Starting is idempotent and thread-safe in both modes.
+    """
+    
+    def __init__(self, *args, lazy: bool = True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy = lazy
+        self._start_lock = threading.Lock()
+        self._running = False
+    
+    @property
+    def is_running(self) -> bool:
+        """Whether the server process is currently running."""
+        return self._running
+    
+    def __enter__(self):
+        if not self.lazy:
+            self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop(exc_type, exc_val, exc_tb)
+    
+    def start(self) -> "LazyMCPClient":
+        """Start the server unless it is already running."""
+        with self._start_lock:
+            if not self._running:
+                super().start()
+                self._running = True
+        return self
+    
+    def stop(self, exc_type=None, exc_val=None, exc_tb=None) -> None:
+        """Stop the server if it is running."""
+        with self._start_lock:
+            if self._running:
+                self._running = False
+                super().stop(exc_type, exc_val, exc_tb)
+    
+    def _list_tools_uncached(self, pagination_token: Optional[str], **kwargs):
+        self.start()
+        return super()._list_tools_uncached(pagination_token, **kwargs)
+    
+    def call_tool_sync(self, *args, **kwargs):
+        self.start()
+        return super().call_tool_sync(*args, **kwargs)
+    
+    async def call_tool_async(self, *args, **kwargs):
+        # Spawning the server blocks, so keep it off the agent's event loop
+        await asyncio.to_thread(self.start)
+        return await super().call_tool_async(*args, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _merged_env(overrides: Tuple[Tuple[str, str], ...]) -> Dict[str, str]:
+    """
+    Return the process environment merged with server-specific overrides.
+    
+    Cached per set of overrides, so the environment is copied once per
+    distinct server configuration rather than for every client. The process
+    environment is captured on first use for each set of overrides; the
+    returned dict is shared and must not be modified.
+    """
+    return {**os.environ, **dict(overrides)}
+
+
+def create_mcp_client(
+    command: str,
+    args: List[str],
+    env: Optional[Dict[str, str]] = None,
+    startup_timeout: int = MCP_STARTUP_TIMEOUT_SECONDS,
+    lazy: bool = True,
+    disk_cache_key: Optional[str] = None
+) -> LazyMCPClient:
     """
     Create an MCP client with standardized configuration.
     
@@ -21,9 +236,12 @@ def create_mcp_client(command: str, args: List[str], env: Optional[Dict[str, str
         command: Command to execute (e.g., "uvx")
         args: Arguments for the command
         env: Optional environment variables to pass to the server
+        startup_timeout: Seconds to wait for the server handshake before giving up
+        lazy: Defer spawning the server until a tool is first listed or called
+        disk_cache_key: Persist discovered tools under this tool_cache_key()
         
     Returns:
-        Configured MCPClient instance
+        Configured LazyMCPClient instance
         
     Raises:
         ConnectionError: If client cannot be created
@@ -32,13 +250,17 @@ def create_mcp_client(command: str, args: List[str], env: Optional[Dict[str, str
     """
     try:
         # Merge environment variables
-        server_env = os.environ.copy()
-        if env:
-            server_env.update(env)
-            
-        return MCPClient(lambda: stdio_client(
-            StdioServerParameters(command=command, args=args, env=server_env)
-        ))
+        server_env = _merged_env(tuple(sorted(env.items())) if env else ())
+        
+        # Build the server parameters once; the transport factory is invoked
+        # again every time the client (re)starts
+        params = StdioServerParameters(command=command, args=args, env=server_env)
+        return LazyMCPClient(
+            lambda: stdio_client(params),
+            startup_timeout=startup_timeout,
+            lazy=lazy,
+            disk_cache_key=disk_cache_key
+        )
     except FileNotFoundError as e:
         raise FileNotFoundError(f"Command '{command}' not found. Ensure it's installed and in PATH: {e}")
     except PermissionError as e:
@@ -47,58 +269,275 @@ def create_mcp_client(command: str, args: List[str], env: Optional[Dict[str, str
         raise ConnectionError(f"Failed to create MCP client: {e}")
 
 
+@functools.lru_cache(maxsize=1024)
 def _truncate_description(description: str, max_length: int = DEFAULT_DESCRIPTION_MAX_LENGTH) -> str:
-    """Truncate description to specified length with ellipsis."""
-    if len(description) > max_length:
-        return description[:max_length - len(DESCRIPTION_TRUNCATE_SUFFIX)] + DESCRIPTION_TRUNCATE_SUFFIX
-    return description
+    """Shorten description to specified length at a word boundary, with ellipsis."""
+    # Descriptions that fit keep their whitespace and line structure
+    if len(description) <= max_length:
+        return description
+    shortened = textwrap.shorten(description, max_length, placeholder=DESCRIPTION_TRUNCATE_SUFFIX)
+    # shorten() drops a leading word longer than the width (e.g. a long URL)
+    # along with everything after it; cut mid-word instead
+    if len(shortened) < max_length // 2:
+        collapsed = " ".join(description.split())
+        return collapsed[:max_length - len(DESCRIPTION_TRUNCATE_SUFFIX)] + DESCRIPTION_TRUNCATE_SUFFIX
+    return shortened
+
+
+def render_tool_entry(name: str, description: str) -> str:
+    """Format a tool as a line of the CLI tools listing."""
+    return f"  • {name} - {_truncate_description(description, LISTING_DESCRIPTION_MAX_LENGTH)}"
+
+
+@dataclass(frozen=True, slots=True)
+class ToolInfoEntry:
+    """A tool as shown in the CLI tools listing."""
+    
+    server: str
+    name: str
+    description: str
+    rendered: str
+    
+    @classmethod
+    def create(cls, server: str, name: str, description: str) -> "ToolInfoEntry":
+        """Build an entry, pre-rendering its listing line."""
+        return cls(server, name, description, render_tool_entry(name, description))
 
 
 def _extract_description_from_spec(tool_spec) -> str:
     """Extract description from tool spec, handling different formats."""
-    if hasattr(tool_spec, 'description'):
-        return tool_spec.description.split('\n')[0].strip()
-    elif isinstance(tool_spec, dict) and 'description' in tool_spec:
-        return tool_spec['description'].split('\n')[0].strip()
-    return 'No description available'
+    description = getattr(tool_spec, 'description', None)
+    if description is None and isinstance(tool_spec, dict):
+        description = tool_spec.get('description')
+    if description is None:
+        return 'No description available'
+    return description.partition('\n')[0].strip()
 
 
 def get_tool_info(tool) -> Dict[str, str]:
     """
     Extract tool information in a standardized format.
     
+    The result is memoized on the tool object, so listing the same tools
+    again does not re-parse their specs.
+    
     Args:
         tool: MCP tool object
         
     Returns:
-        Dictionary with tool name and description
+        Dictionary with tool name, lowercased name for filtering and description
     """
+    cached_info = getattr(tool, '_cached_info', None)
+    if cached_info is not None:
+        return cached_info
+    
     tool_name = getattr(tool, 'tool_name', 'Unknown Tool')
     tool_desc = 'No description available'
     
     # Try to get description from tool_spec
-    if hasattr(tool, 'tool_spec') and tool.tool_spec:
-        full_desc = _extract_description_from_spec(tool.tool_spec)
+    tool_spec = getattr(tool, 'tool_spec', None)
+    if tool_spec:
+        full_desc = _extract_description_from_spec(tool_spec)
         tool_desc = _truncate_description(full_desc)
     
-    return {
+    info = {
         'name': tool_name,
+        'name_lower': tool_name.lower(),
         'description': tool_desc
     }
+    try:
+        tool._cached_info = info
+    except AttributeError:
+        # Tools with __slots__ or read-only attributes are parsed on every call
+        pass
+    return info
+
+
+def tool_cache_key(server_config: Dict[str, Any]) -> str:
+    """
+    Compute the tool cache key for an MCP server configuration.
+    
+    The key covers the command, arguments and environment of the server plus the
+    modification time of the launcher binary, so upgrading uv or changing the
+    server configuration invalidates the cached catalog.
+    
+    Args:
+        server_config: Entry from MCP_SERVERS
+        
+    Returns:
+        Hex digest identifying the server's tool catalog
+    """
+    command = server_config["command"]
+    canonical = json.dumps(
+        {
+            "command": command,
+            "args": server_config["args"],
+            "env": server_config.get("env") or {},
+        },
+        sort_keys=True
+    )
+    
+    launcher_mtime = 0.0
+    launcher_path = shutil.which(command)
+    if launcher_path:
+        try:
+            launcher_mtime = os.stat(launcher_path).st_mtime
+        except OSError:
+            pass
+    
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(canonical.encode("utf-8"))
+    digest.update(repr(launcher_mtime).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _tool_cache_path(cache_key: str) -> str:
+    """Return the on-disk location of a cached tool catalog."""
+    return os.path.join(MCP_TOOL_CACHE_DIR, f"mcp-tools-{cache_key}.json")
+
+
+def load_cached_tools(cache_key: str, client: MCPClient) -> Optional[List[MCPAgentTool]]:
+    """
+    Load a previously discovered tool catalog from disk.
+    
+    The returned tools are bound to ``client``; the server itself is only
+    contacted when one of them is invoked. A CachedMCPClient is also primed
+    with the tools and the age of the cache file, so its cache_age_seconds
+    reflects when the catalog was actually discovered.
+    
+    Args:
+        cache_key: Key returned by tool_cache_key()
+        client: MCP client that will execute the tools
+        
+    Returns:
+        List of tools, or None if there is no usable cache entry
+    """
+    try:
+        with open(_tool_cache_path(cache_key), encoding="utf-8") as cache_file:
+            saved_at = os.fstat(cache_file.fileno()).st_mtime
+            entries = json.load(cache_file)
+        tools = [MCPAgentTool(MCPTool.model_validate(entry), client) for entry in entries]
+    except (OSError, ValueError, TypeError):
+        return None
+    
+    if isinstance(client, CachedMCPClient):
+        client.prime_cache(tools, max(0.0, time() - saved_at))
+    return tools
+
+
+def save_tool_cache(cache_key: str, tools: List[MCPAgentTool]) -> None:
+    """
+    Persist a discovered tool catalog to disk.
+    
+    Args:
+        cache_key: Key returned by tool_cache_key()
+        tools: Tools returned by MCPClient.list_tools_sync()
+    """
+    entries = [tool.mcp_tool.model_dump(mode="json", exclude_none=True) for tool in tools]
+    _write_cache_file(_tool_cache_path(cache_key), entries)
 
 
-def test_mcp_server(server_name: str, command: str, args: List[str]) -> Dict[str, Any]:
+def _write_cache_file(path: str, data: Any) -> None:
+    """Atomically write JSON data to a file in the cache directory."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(MCP_TOOL_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as cache_file:
+            json.dump(data, cache_file)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Caching is an optimization only; a read-only home directory is fine
+        pass
+
+
+def _test_result_cache_path(
+    command: str,
+    args: List[str],
+    env: Optional[Dict[str, str]] = None
+) -> str:
+    """Return the on-disk location of a cached test_mcp_server() result."""
+    cache_key = tool_cache_key({"command": command, "args": args, "env": env})
+    return os.path.join(MCP_TOOL_CACHE_DIR, f"mcp-test-{cache_key}.json")
+
+
+def _load_test_result(path: str) -> Optional[Dict[str, Any]]:
+    """Load a cached test result younger than MCP_TEST_CACHE_TTL_SECONDS."""
+    try:
+        with open(path, encoding="utf-8") as cache_file:
+            if time() - os.fstat(cache_file.fileno()).st_mtime >= MCP_TEST_CACHE_TTL_SECONDS:
+                return None
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+
+# Long-lived clients shared across calls, keyed by command, args and env
+_shared_clients: Dict[Tuple, LazyMCPClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _get_shared_client(
+    command: str,
+    args: List[str],
+    env: Optional[Dict[str, str]] = None
+) -> LazyMCPClient:
+    """
+    Return the process-wide client for a server configuration.
+    
+    The server is spawned on first use and kept running, so later calls skip
+    the uvx resolve and server startup. All shared clients are stopped at
+    interpreter exit.
+    """
+    key = (command, tuple(args), tuple(sorted(env.items())) if env else ())
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = _shared_clients[key] = create_mcp_client(command, args, env)
+        return client
+
+
+@atexit.register
+def _stop_shared_clients() -> None:
+    """Stop every shared client's server."""
+    with _shared_clients_lock:
+        clients = list(_shared_clients.values())
+        _shared_clients.clear()
+    for client in clients:
+        try:
+            client.stop()
+        except Exception:
+            pass
+
+
+def test_mcp_server(
+    server_name: str,
+    command: str,
+    args: List[str],
+    env: Optional[Dict[str, str]] = None,
+    use_cache: bool = True
+) -> Dict[str, Any]:
     """
     Test MCP server connectivity and return tool information.
     
+    Successful results are cached on disk for MCP_TEST_CACHE_TTL_SECONDS, so
+    repeated runs skip spawning the server.
+    
     Args:
         server_name: Human-readable server name
         command: Command to execute
         args: Arguments for the command
+        env: Environment variables for the server process
+        use_cache: Return a recent cached result instead of contacting the server
         
     Returns:
         Dictionary with test results and tool information
     """
+    cache_path = _test_result_cache_path(command, args, env)
+    if use_cache:
+        cached_result = _load_test_result(cache_path)
+        if cached_result is not None:
+            return {**cached_result, 'server_name': server_name}
+    
     result = {
         'server_name': server_name,
         'success': False,
@@ -108,17 +547,17 @@ def test_mcp_server(server_name: str, command: str, args: List[str]) -> Dict[str
     }
     
     try:
-        client = create_mcp_client(command, args)
+        # Reuse the running server from earlier tests of the same configuration
+        client = _get_shared_client(command, args, env)
         
-        with client:
-            mcp_tools = client.list_tools_sync()
-            result['success'] = True
-            result['tool_count'] = len(mcp_tools)
-            
-            # Get tool information
-            for tool in mcp_tools:
-                tool_info = get_tool_info(tool)
-                result['tools'].append(tool_info)
+        mcp_tools = client.list_tools_sync()
+        result['success'] = True
+        result['tool_count'] = len(mcp_tools)
+        
+        # Get tool information
+        for tool in mcp_tools:
+            tool_info = get_tool_info(tool)
+            result['tools'].append(tool_info)
                 
     except ConnectionError as e:
         result['error'] = f"Connection failed: {e}"
@@ -129,37 +568,59 @@ def test_mcp_server(server_name: str, command: str, args: List[str]) -> Dict[str
     except Exception as e:
         result['error'] = f"Unexpected error: {e}"
     
+    if result['success']:
+        _write_cache_file(cache_path, result)
     return result
 
 
+def _uvx_package(package: str) -> str:
+    """
+    Return the uvx package spec for an MCP server.
+    
+    Packages pinned in MCP_SERVER_VERSIONS use that exact version; others are
+    left unpinned so uvx reuses its cached environment instead of checking
+    PyPI for a newer release (as ``@latest`` does) on every launch.
+    """
+    version = MCP_SERVER_VERSIONS.get(package)
+    return f"{package}=={version}" if version else package
+
+
 # MCP server configurations
+# Servers are spawned on first tool use; set "warm" to True to start a server
+# together with the agent instead.
 MCP_SERVERS = [
     {
         "name": "AWS Documentation",
+        "description": "Search and read AWS documentation pages.",
         "command": "uvx",
-        "args": ["awslabs.aws-documentation-mcp-server@latest"]
+        "args": [_uvx_package("awslabs.aws-documentation-mcp-server")],
+        "warm": False
     },
     {
         "name": "AWS Knowledge",
+        "description": "Query AWS knowledge on services, regional availability and best practices.",
         "command": "uvx", 
         "args": [
-            "mcp-proxy",
+            _uvx_package("mcp-proxy"),
             "--transport",
             "streamablehttp",
             "https://knowledge-mcp.global.api.aws"
-        ]
+        ],
+        "warm": False
     },
     {
         "name": "AWS EKS",
+        "description": "Inspect and manage Amazon EKS clusters and Kubernetes resources.",
         "command": "uvx",
         "args": [
-            "awslabs.eks-mcp-server@latest",
+            _uvx_package("awslabs.eks-mcp-server"),
             "--allow-write",
             "--allow-sensitive-data-access"
         ],
         "env": {
             "AWS_DEFAULT_REGION": "us-east-1",
             "AWS_REGION": "us-east-1"
-        }
+        },
+        "warm": False
     }
 ]
\ No newline at end of file
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Rate limiting utilities for AWS DevOps agent.
+"""
+
+import threading
+from time import monotonic, sleep
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    
+    Tokens refill continuously at ``rate`` per second up to ``capacity``, so
+    short bursts of up to ``capacity`` calls pass immediately while the long
+    term rate stays at ``rate``.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+    
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Take one token, waiting for it to become available.
+        
+        Args:
+            timeout: Maximum time to wait, or None to wait indefinitely
+        
+        Returns:
+            True if a token was taken, False if the timeout expired first
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            with self._lock:
+                now = monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            
+            if deadline is not None and now + wait > deadline:
+                return False
+            sleep(wait)
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """
+    Token bucket whose rate adapts to the server's limit (AIMD).
+    
+    Every success raises the rate additively up to ``max_rate``; every rate
+    limit response cuts it multiplicatively down to ``min_rate`` and empties
+    the bucket, so the next call waits a full interval at the new rate.
+    """
+    
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        min_rate: float,
+        max_rate: float,
+        increase: float = 0.05,
+        decrease_factor: float = 0.5
+    ):
+        super().__init__(rate, capacity)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+    
+    def on_success(self) -> None:
+        """Raise the rate after a call the server accepted."""
+        with self._lock:
+            self._refill(monotonic())
+            self.rate = min(self.rate + self.increase, self.max_rate)
+    
+    def on_rate_limited(self) -> None:
+        """Lower the rate and drain the bucket after a rate limit response."""
+        with self._lock:
+            self._refill(monotonic())
+            self.rate = max(self.rate * self.decrease_factor, self.min_rate)
+            self._tokens = 0
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Embedding-based response cache for AWS DevOps agent.
+"""
+
+import json
+import operator
+import os
+import threading
+from typing import List, Optional, Tuple
+
+from config.config import (
+    AWS_DEFAULT_REGION, EMBEDDING_DIMENSIONS, EMBEDDING_MODEL_ID,
+    SEMANTIC_CACHE_MAX_ENTRIES, SEMANTIC_CACHE_THRESHOLD, get_bedrock_client_config,
+    get_boto_session
+)
+
+
+class SemanticCache:
+    """
+    Response cache keyed by the meaning of the prompt.
+    
+    Prompts are embedded with a Bedrock Titan text embedding model. Embeddings
+    are normalized, so cosine similarity is a plain dot product, and a linear
+    scan is fast enough for the few thousand entries an interactive session
+    produces. Entries are persisted to ``path`` as JSON, so the cache survives
+    restarts; callers should scope the path to the model and system prompt.
+    """
+    
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+        model_id: str = EMBEDDING_MODEL_ID,
+        dimensions: int = EMBEDDING_DIMENSIONS
+    ):
+        self.path = path
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model_id = model_id
+        self.dimensions = dimensions
+        self._lock = threading.Lock()
+        self._client = None
+        self._entries: List[Tuple[List[float], str]] = self._load()
+    
+    def _load(self) -> List[Tuple[List[float], str]]:
+        """Read persisted entries, ignoring a missing or unreadable file."""
+        if not self.path:
+            return []
+        try:
+            with open(self.path, encoding="utf-8") as cache_file:
+                return [(entry["embedding"], entry["response"]) for entry in json.load(cache_file)]
+        except (OSError, ValueError, TypeError, KeyError):
+            return []
+    
+    def _save(self, entries: List[Tuple[List[float], str]]) -> None:
+        """Persist entries atomically; failures only cost the next session's hits."""
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as cache_file:
+                json.dump([{"embedding": e, "response": r} for e, r in entries], cache_file)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+    
+    def _get_client(self):
+        """Return the Bedrock runtime client, created on first use."""
+        if self._client is None:
+            self._client = get_boto_session().client(
+                'bedrock-runtime', region_name=AWS_DEFAULT_REGION, config=get_bedrock_client_config()
+            )
+        return self._client
+    
+    def embed(self, text: str) -> List[float]:
+        """Return the normalized embedding of text."""
+        response = self._get_client().invoke_model(
+            modelId=self.model_id,
+            body=json.dumps({"inputText": text, "dimensions": self.dimensions, "normalize": True}),
+            contentType="application/json",
+            accept="application/json"
+        )
+        return json.loads(response["body"].read())["embedding"]
+    
+    def lookup(self, embedding: List[float]) -> Optional[str]:
+        """Return the response of the most similar cached prompt above the threshold."""
+        with self._lock:
+            entries = self._entries
+        
+        best_score, best_response = max(
+            ((sum(map(operator.mul, embedding, cached)), response) for cached, response in entries),
+            key=operator.itemgetter(0),
+            default=(0.0, None)
+        )
+        return best_response if best_score >= self.threshold else None
+    
+    def add(self, embedding: List[float], response: str) -> None:
+        """Cache a response, dropping the oldest entries beyond max_entries."""
+        with self._lock:
+            # Replace rather than mutate the list so lookups can scan without the lock
+            self._entries = (self._entries + [(embedding, response)])[-self.max_entries:]
+            entries = self._entries
+        self._save(entries)
+    
+    def clear(self) -> None:
+        """Remove all entries, including the persisted ones."""
+        with self._lock:
+            self._entries = []
+        self._save([])
@@ -3,52 +3,104 @@
 Timeout utilities for AWS DevOps agent.
 """
 
-import signal
+import asyncio
+import builtins
 import functools
-from typing import Callable, Any, TypeVar, Optional
-from contextlib import contextmanager
+import threading
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from typing import Awaitable, Callable, TypeVar, Optional
 
 T = TypeVar('T')
 
 
-class TimeoutError(Exception):
+class TimeoutError(builtins.TimeoutError):
     """Raised when an operation times out."""
     pass
 
 
-@contextmanager
-def timeout_context(timeout_seconds: int, message: str = "Operation timed out"):
+def run_with_timeout(
+    func: Callable[..., T],
+    timeout_seconds: float,
+    *args,
+    message: Optional[str] = None,
+    **kwargs
+) -> T:
     """
-    Context manager for timeout operations.
+    Call a function in a worker thread and wait for it with a timeout.
+    
+    Unlike SIGALRM-based timeouts this works from any thread and on any
+    platform, and never interrupts the call midway (e.g. inside an HTTP
+    request). A call that times out is abandoned and left to finish in its
+    daemon thread, so it cannot block interpreter shutdown.
     
     Args:
-        timeout_seconds: Timeout in seconds
-        message: Error message for timeout
+        func: Function to call
+        timeout_seconds: Maximum time to wait for the result
+        *args: Positional arguments for func
+        message: Optional custom timeout message
+        **kwargs: Keyword arguments for func
+        
+    Returns:
+        The function's return value
         
     Raises:
-        TimeoutError: If operation times out
+        TimeoutError: If the call does not finish in time
+    """
+    func_name = getattr(func, '__name__', type(func).__name__)
+    future: Future = Future()
+    
+    def runner() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=runner, name=f"timeout-{func_name}", daemon=True).start()
+    
+    try:
+        return future.result(timeout=timeout_seconds)
+    except FuturesTimeoutError:
+        timeout_msg = message or f"{func_name} timed out after {timeout_seconds} seconds"
+        raise TimeoutError(timeout_msg) from None
+
+
+async def run_with_timeout_async(
+    awaitable: Awaitable[T],
+    timeout_seconds: float,
+    message: Optional[str] = None
+) -> T:
     """
-    def timeout_handler(signum, frame):
-        raise TimeoutError(message)
+    Await a coroutine or future with a timeout.
     
-    old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-    signal.alarm(timeout_seconds)
+    The awaitable is cancelled when the timeout expires, so unlike
+    run_with_timeout() nothing keeps running in the background.
     
+    Args:
+        awaitable: Coroutine or future to await
+        timeout_seconds: Maximum time to wait for the result
+        message: Optional custom timeout message
+        
+    Returns:
+        The awaitable's result
+        
+    Raises:
+        TimeoutError: If the awaitable does not finish in time
+    """
     try:
-        yield
-    finally:
-        signal.alarm(0)
-        if old_handler is not None:
-            try:
-                signal.signal(signal.SIGALRM, old_handler)
-            except (OSError, ValueError):
-                pass  # Ignore cleanup errors
+        return await asyncio.wait_for(awaitable, timeout=timeout_seconds)
+    except asyncio.TimeoutError:
+        raise TimeoutError(message or f"Operation timed out after {timeout_seconds} seconds") from None
 
 
-def timeout_decorator(timeout_seconds: int, message: Optional[str] = None):
+def timeout_decorator(timeout_seconds: float, message: Optional[str] = None):
     """
     Decorator to add timeout to functions.
     
+    Works for both regular and async functions: regular functions are run
+    with run_with_timeout(), coroutine functions with run_with_timeout_async().
+    
     Args:
         timeout_seconds: Timeout in seconds
         message: Optional custom timeout message
@@ -57,10 +109,16 @@ def timeout_decorator(timeout_seconds: int, message: Optional[str] = None):
         Decorated function that raises TimeoutError on timeout
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        timeout_msg = message or f"{func.__name__} timed out after {timeout_seconds} seconds"
+        
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await run_with_timeout_async(func(*args, **kwargs), timeout_seconds, timeout_msg)
+            return async_wrapper
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            timeout_msg = message or f"{func.__name__} timed out after {timeout_seconds} seconds"
-            with timeout_context(timeout_seconds, timeout_msg):
-                return func(*args, **kwargs)
+            return run_with_timeout(func, timeout_seconds, *args, message=timeout_msg, **kwargs)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
@@ -8,6 +8,8 @@ import os
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# The tool modules import their siblings relative to src/
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 # Configuration constants
 MCP_COMMAND = 'uvx'
@@ -16,7 +18,7 @@ TEST_QUERY = "What is AWS S3?"
 RESPONSE_PREVIEW_LENGTH = 200
 
 try:
-    from config.config import MODEL_ID, MODEL_TEMPERATURE, SYSTEM_PROMPT
+    from config.config import MODEL_ID, MODEL_TEMPERATURE, SYSTEM_PROMPT, initialize_configuration
     from src.tools.websearch_tool import websearch
     from strands.agent import Agent
     from strands.models.bedrock import BedrockModel
@@ -78,6 +80,7 @@ def test_mcp_connection() -> bool:
 
 def main():
     """Main test execution with summary reporting."""
+    initialize_configuration()
     print("🧪 Simple MCP Test - Testing agent with just websearch first...")
     
     # Run tests
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test the TTL cache used for search results and agent responses.
+
+Usage:
+    python3 tests/test_cache_utils.py
+"""
+
+import os
+import sys
+from time import sleep
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.cache_utils import TTLCache
+
+# Short enough to keep the expiry tests fast
+SHORT_TTL_SECONDS = 0.05
+
+
+def test_lru_eviction() -> bool:
+    """A full cache evicts its least recently used entry."""
+    print("Testing LRU eviction...")
+    cache: TTLCache[str] = TTLCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    cache.get("a")
+    cache.set("c", "C")
+    
+    kept = (cache.get("a"), cache.get("b"), cache.get("c"))
+    if kept == ("A", None, "C") and len(cache) == 2:
+        print("✅ Least recently used entry evicted")
+        return True
+    print(f"❌ LRU eviction failed: kept={kept}, size={len(cache)}")
+    return False
+
+
+def test_overwrite_refreshes_recency() -> bool:
+    """Setting an existing key keeps one entry and marks it recently used."""
+    print("Testing overwrite...")
+    cache: TTLCache[str] = TTLCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    cache.set("a", "A2")
+    cache.set("c", "C")
+    
+    kept = (cache.get("a"), cache.get("b"), cache.get("c"))
+    if kept == ("A2", None, "C"):
+        print("✅ Overwritten entry updated and kept")
+        return True
+    print(f"❌ Overwrite failed: kept={kept}")
+    return False
+
+
+def test_ttl_expiry() -> bool:
+    """Entries expire after the cache's time to live."""
+    print("Testing TTL expiry...")
+    cache: TTLCache[str] = TTLCache(maxsize=8, ttl_seconds=SHORT_TTL_SECONDS)
+    cache.set("a", "A")
+    fresh = cache.get("a")
+    sleep(SHORT_TTL_SECONDS * 2)
+    expired = cache.get("a")
+    
+    if fresh == "A" and expired is None and len(cache) == 0:
+        print("✅ Entry served while fresh and dropped once expired")
+        return True
+    print(f"❌ TTL expiry failed: fresh={fresh}, expired={expired}, size={len(cache)}")
+    return False
+
+
+def test_per_entry_ttl() -> bool:
+    """A per-entry time to live overrides the cache's default."""
+    print("Testing per-entry TTL...")
+    cache: TTLCache[str] = TTLCache(maxsize=8, ttl_seconds=60)
+    cache.set("short", "S", ttl_seconds=SHORT_TTL_SECONDS)
+    cache.set("default", "D")
+    sleep(SHORT_TTL_SECONDS * 2)
+    
+    kept = (cache.get("short"), cache.get("default"))
+    if kept == (None, "D"):
+        print("✅ Per-entry TTL applied")
+        return True
+    print(f"❌ Per-entry TTL failed: kept={kept}")
+    return False
+
+
+def test_stats_and_clear() -> bool:
+    """Hits and misses are counted, and clear() resets entries and counts."""
+    print("Testing statistics...")
+    cache: TTLCache[str] = TTLCache(maxsize=8, ttl_seconds=60)
+    cache.set("a", "A")
+    cache.get("a")
+    cache.get("a")
+    cache.get("missing")
+    counted = dict(cache.stats)
+    cache.clear()
+    
+    if counted == {"hits": 2, "misses": 1} and cache.stats == {"hits": 0, "misses": 0} and len(cache) == 0:
+        print("✅ Hits and misses counted and reset")
+        return True
+    print(f"❌ Statistics failed: counted={counted}, after clear={cache.stats}")
+    return False
+
+
+def main():
+    """Run all cache tests and report a summary."""
+    tests = [
+        test_lru_eviction,
+        test_overwrite_refreshes_recency,
+        test_ttl_expiry,
+        test_per_entry_ttl,
+        test_stats_and_clear,
+    ]
+    results = [test() for test in tests]
+    
+    print("\n" + "="*50)
+    print(f"Results: {sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,15 +6,19 @@ This script tests all configured MCP servers or a specific server by name.
 Usage:
     python test_mcp_usage.py              # Test all servers
     python test_mcp_usage.py <server_name> # Test specific server
+    python test_mcp_usage.py --no-cache   # Ignore cached results from earlier runs
 """
 
+import asyncio
 import os
 import sys
+from itertools import islice
 from typing import Dict, List, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from src.utils.async_utils import install_uvloop
 from src.utils.mcp_utils import test_mcp_server, MCP_SERVERS
 
 # Set AWS region
@@ -35,7 +39,7 @@ def display_test_results(results: Dict[str, any]) -> None:
         
         # Show first 5 tools with better formatting
         max_display = min(5, tool_count)
-        for i, tool in enumerate(results['tools'][:max_display], 1):
+        for i, tool in enumerate(islice(results['tools'], max_display), 1):
             tool_name = tool.get('name', 'Unknown')
             print(f"  {i:2d}. {tool_name}")
         
@@ -46,11 +50,11 @@ def display_test_results(results: Dict[str, any]) -> None:
         if 'EKS' in server_name.upper():
             cluster_tools = [
                 tool for tool in results['tools'] 
-                if 'cluster' in tool.get('name', '').lower()
+                if 'cluster' in (tool.get('name_lower') or tool.get('name', '').lower())
             ]
             if cluster_tools:
                 print(f"\n🎯 Found {len(cluster_tools)} cluster-related tools:")
-                for tool in cluster_tools[:3]:  # Limit display
+                for tool in islice(cluster_tools, 3):  # Limit display
                     print(f"  - {tool['name']}")
                 if len(cluster_tools) > 3:
                     print(f"  ... and {len(cluster_tools) - 3} more cluster tools")
@@ -67,11 +71,12 @@ def display_test_results(results: Dict[str, any]) -> None:
             print("💡 Hint: Check internet connection and server availability")
 
 
-def test_specific_server(server_name: str) -> bool:
+def test_specific_server(server_name: str, use_cache: bool = True) -> bool:
     """Test a specific MCP server by name.
     
     Args:
         server_name: Name of the server to test
+        use_cache: Accept a recent cached result for the server
         
     Returns:
         True if test passed, False otherwise
@@ -90,29 +95,53 @@ def test_specific_server(server_name: str) -> bool:
     results = test_mcp_server(
         server_config['name'],
         server_config['command'],
-        server_config['args']
+        server_config['args'],
+        server_config.get('env'),
+        use_cache=use_cache
     )
     display_test_results(results)
     return results['success']
 
 
-def test_all_servers() -> Dict[str, bool]:
-    """Test all configured MCP servers.
+async def atest_mcp_server(server_config: Dict, use_cache: bool = True) -> Dict:
+    """Test one MCP server in a worker thread so several can run at once.
     
+    Args:
+        server_config: Entry from MCP_SERVERS
+        use_cache: Accept a recent cached result for the server
+        
+    Returns:
+        Test results from test_mcp_server
+    """
+    return await asyncio.to_thread(
+        test_mcp_server,
+        server_config['name'],
+        server_config['command'],
+        server_config['args'],
+        server_config.get('env'),
+        use_cache=use_cache
+    )
+
+
+def test_all_servers(use_cache: bool = True) -> Dict[str, bool]:
+    """Test all configured MCP servers concurrently.
+    
+    Args:
+        use_cache: Accept recent cached results for the servers
+        
     Returns:
         Dictionary mapping server names to test results
     """
     print("Testing all MCP servers...\n")
     
+    async def run_all() -> List[Dict]:
+        return await asyncio.gather(*(atest_mcp_server(s, use_cache) for s in MCP_SERVERS))
+    
     results = {}
-    for server_config in MCP_SERVERS:
-        test_result = test_mcp_server(
-            server_config['name'],
-            server_config['command'],
-            server_config['args']
-        )
+    # Results come back in configuration order, so the report stays stable
+    for test_result in asyncio.run(run_all()):
         display_test_results(test_result)
-        results[server_config['name']] = test_result['success']
+        results[test_result['server_name']] = test_result['success']
         print()  # Add spacing between servers
     
     return results
@@ -120,14 +149,18 @@ def test_all_servers() -> Dict[str, bool]:
 
 def main() -> None:
     """Main test function with proper exit codes."""
-    if len(sys.argv) > 1:
+    install_uvloop()
+    use_cache = '--no-cache' not in sys.argv
+    server_names = [arg for arg in sys.argv[1:] if arg != '--no-cache']
+    
+    if server_names:
         # Test specific server
-        server_name = sys.argv[1]
-        success = test_specific_server(server_name)
+        server_name = server_names[0]
+        success = test_specific_server(server_name, use_cache)
         sys.exit(0 if success else 1)
     else:
         # Test all servers
-        results = test_all_servers()
+        results = test_all_servers(use_cache)
         
         # Summary
         total_servers = len(results)
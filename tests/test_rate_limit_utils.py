@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test the token bucket rate limiters used by the websearch tool.
+
+Usage:
+    python3 tests/test_rate_limit_utils.py
+"""
+
+import os
+import sys
+from time import monotonic, sleep
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.rate_limit_utils import AdaptiveTokenBucket, TokenBucket
+
+# Rates are high enough that refill waits keep the tests fast
+RATE = 20.0
+TIMING_TOLERANCE_SECONDS = 0.03
+
+
+def test_burst() -> bool:
+    """A full bucket lets `capacity` calls through without waiting."""
+    print("Testing burst up to capacity...")
+    bucket = TokenBucket(RATE, capacity=3)
+    started = monotonic()
+    taken = [bucket.acquire(timeout=0) for _ in range(3)]
+    elapsed = monotonic() - started
+    
+    if all(taken) and not bucket.acquire(timeout=0) and elapsed < TIMING_TOLERANCE_SECONDS:
+        print("✅ Burst passes immediately, next call is limited")
+        return True
+    print(f"❌ Burst failed: taken={taken}, elapsed={elapsed:.3f}s")
+    return False
+
+
+def test_refill() -> bool:
+    """Tokens come back at `rate` per second, never above `capacity`."""
+    print("Testing refill...")
+    bucket = TokenBucket(RATE, capacity=2)
+    bucket.acquire(timeout=0)
+    bucket.acquire(timeout=0)
+    sleep(1.5 / RATE)
+    
+    one_refilled = bucket.acquire(timeout=0) and not bucket.acquire(timeout=0)
+    sleep(10 / RATE)
+    capped = [bucket.acquire(timeout=0) for _ in range(3)] == [True, True, False]
+    
+    if one_refilled and capped:
+        print("✅ Refill follows the rate and stops at capacity")
+        return True
+    print(f"❌ Refill failed: one_refilled={one_refilled}, capped={capped}")
+    return False
+
+
+def test_acquire_waits() -> bool:
+    """acquire() without a timeout waits for the next token."""
+    print("Testing blocking acquire...")
+    bucket = TokenBucket(RATE, capacity=1)
+    bucket.acquire()
+    started = monotonic()
+    taken = bucket.acquire()
+    elapsed = monotonic() - started
+    
+    if taken and elapsed >= 1 / RATE - TIMING_TOLERANCE_SECONDS:
+        print(f"✅ Waited {elapsed:.3f}s for the next token")
+        return True
+    print(f"❌ Blocking acquire failed: taken={taken}, elapsed={elapsed:.3f}s")
+    return False
+
+
+def test_acquire_timeout() -> bool:
+    """acquire() gives up without sleeping when the token would come too late."""
+    print("Testing acquire timeout...")
+    bucket = TokenBucket(rate=1.0, capacity=1)
+    bucket.acquire()
+    started = monotonic()
+    taken = bucket.acquire(timeout=0.1)
+    elapsed = monotonic() - started
+    
+    if not taken and elapsed < TIMING_TOLERANCE_SECONDS:
+        print("✅ Timed out immediately instead of waiting for the token")
+        return True
+    print(f"❌ Acquire timeout failed: taken={taken}, elapsed={elapsed:.3f}s")
+    return False
+
+
+def test_adaptive_increase() -> bool:
+    """Successes raise the rate additively up to `max_rate`."""
+    print("Testing adaptive rate increase...")
+    bucket = AdaptiveTokenBucket(1.0, 1, min_rate=0.5, max_rate=1.2, increase=0.1)
+    bucket.on_success()
+    increased = abs(bucket.rate - 1.1) < 1e-9
+    for _ in range(5):
+        bucket.on_success()
+    
+    if increased and bucket.rate == 1.2:
+        print("✅ Rate rises by the increase and stops at max_rate")
+        return True
+    print(f"❌ Adaptive increase failed: increased={increased}, rate={bucket.rate}")
+    return False
+
+
+def test_adaptive_decrease() -> bool:
+    """Rate limits cut the rate multiplicatively down to `min_rate` and drain the bucket."""
+    print("Testing adaptive rate decrease...")
+    bucket = AdaptiveTokenBucket(4.0, 3, min_rate=0.5, max_rate=8.0, decrease_factor=0.5)
+    bucket.on_rate_limited()
+    halved = bucket.rate == 2.0
+    drained = not bucket.acquire(timeout=0)
+    for _ in range(5):
+        bucket.on_rate_limited()
+    
+    if halved and drained and bucket.rate == 0.5:
+        print("✅ Rate halves, bucket drains and rate stops at min_rate")
+        return True
+    print(f"❌ Adaptive decrease failed: halved={halved}, drained={drained}, rate={bucket.rate}")
+    return False
+
+
+def main():
+    """Run all rate limiter tests and report a summary."""
+    tests = [
+        test_burst,
+        test_refill,
+        test_acquire_waits,
+        test_acquire_timeout,
+        test_adaptive_increase,
+        test_adaptive_decrease,
+    ]
+    results = [test() for test in tests]
+    
+    print("\n" + "="*50)
+    print(f"Results: {sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()